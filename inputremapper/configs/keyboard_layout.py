@@ -21,7 +21,7 @@
 import json
 import re
 import subprocess
-from typing import Optional, List, Iterable, Tuple
+from typing import Optional, List, Iterable, Dict
 
 import evdev
 
@@ -40,30 +40,40 @@ XMODMAP_FILENAME = "xmodmap.json"
 
 LAZY_LOAD = None
 
+# for example "keycode  64 = Alt_L Meta_L Alt_L Meta_L"
+_XMODMAP_LINE = re.compile(r"(\d+) = (.+)")
+
+_LAZY_LOADED_ATTRIBUTES = frozenset(
+    ["_mapping", "_xmodmap_names", "_case_insensitive_mapping"]
+)
+
 
 class KeyboardLayout:
     """Stores information about all available keycodes."""
 
     _mapping: Optional[dict] = LAZY_LOAD
-    _xmodmap: Optional[List[Tuple[str, str]]] = LAZY_LOAD
+    # maps codes to the first name that xmodmap reported for them
+    _xmodmap_names: Optional[Dict[int, str]] = LAZY_LOAD
     _case_insensitive_mapping: Optional[dict] = LAZY_LOAD
 
+    def __init__(self):
+        # Results of `get`. Has to be cleared whenever _mapping changes.
+        self._get_cache: Dict[str, Optional[int]] = {}
+
     def __getattribute__(self, wanted: str):
         """To lazy load keyboard_layout info only when needed.
 
         For example, this helps to keep logs of input-remapper-control clear when it
         doesn't need it the information.
         """
-        lazy_loaded_attributes = ["_mapping", "_xmodmap", "_case_insensitive_mapping"]
-        for lazy_loaded_attribute in lazy_loaded_attributes:
-            if wanted != lazy_loaded_attribute:
-                continue
-
-            if object.__getattribute__(self, lazy_loaded_attribute) is LAZY_LOAD:
-                # initialize _mapping and such with an empty dict, for populate
-                # to write into
-                object.__setattr__(self, lazy_loaded_attribute, {})
-                object.__getattribute__(self, "populate")()
+        if (
+            wanted in _LAZY_LOADED_ATTRIBUTES
+            and object.__getattribute__(self, wanted) is LAZY_LOAD
+        ):
+            # initialize _mapping and such with an empty dict, for populate
+            # to write into
+            object.__setattr__(self, wanted, {})
+            object.__getattribute__(self, "populate")()
 
         return object.__getattribute__(self, wanted)
 
@@ -77,6 +87,7 @@ class KeyboardLayout:
         if not codes:
             return self._mapping.keys()
 
+        codes = set(codes)
         return [name for name, code in self._mapping.items() if code in codes]
 
     def correct_case(self, symbol: str):
@@ -100,8 +111,20 @@ class KeyboardLayout:
             logger.error('Call to `xmodmap -pke` failed with "%s"', e)
             return
 
-        self._xmodmap = re.findall(r"(\d+) = (.+)\n", xmodmap + "\n")
-        xmodmap_dict = self._find_legit_mappings()
+        xmodmap_dict = {}
+        self._xmodmap_names = {}
+        for match in _XMODMAP_LINE.finditer(xmodmap):
+            code = int(match[1]) - XKB_KEYCODE_OFFSET
+            # there might be multiple, like:
+            # keycode  64 = Alt_L Meta_L Alt_L Meta_L
+            # keycode 204 = NoSymbol Alt_L NoSymbol Alt_L
+            # Alt_L should map to code 64. Writing code 204 only works
+            # if a modifier is applied at the same time. So take the first
+            # one.
+            name = match[2].split()[0]
+            xmodmap_dict[name] = code
+            self._xmodmap_names.setdefault(code, name)
+
         if len(xmodmap_dict) == 0:
             logger.info("`xmodmap -pke` did not yield any symbol")
             return
@@ -109,18 +132,32 @@ class KeyboardLayout:
         # Write this stuff into the input-remapper config directory, because
         # the systemd service won't know the user sessions xmodmap.
         path = PathUtils.get_config_path(XMODMAP_FILENAME)
-        PathUtils.touch(path)
-        with open(path, "w") as file:
-            logger.debug('Writing "%s"', path)
-            json.dump(xmodmap_dict, file, indent=4)
+        content = json.dumps(xmodmap_dict, indent=4)
+        if self._read_file(path) == content:
+            # Usually the layout didn't change since the previous start
+            logger.debug('"%s" is up to date', path)
+        else:
+            PathUtils.touch(path)
+            with open(path, "w") as file:
+                logger.debug('Writing "%s"', path)
+                file.write(content)
 
         for name, code in xmodmap_dict.items():
             self._set(name, code)
 
+    @staticmethod
+    def _read_file(path: str) -> Optional[str]:
+        """Get the content of the file, or None if it can't be read."""
+        try:
+            with open(path, "r") as file:
+                return file.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+
     def _use_linux_evdev_symbols(self):
         """Look up the evdev constant names and use them."""
         for name, ecode in evdev.ecodes.ecodes.items():
-            if name.startswith("KEY") or name.startswith("BTN"):
+            if name.startswith(("KEY", "BTN")):
                 self._set(name, ecode)
 
     def populate(self):
@@ -157,16 +194,28 @@ class KeyboardLayout:
         """Map name to code."""
         self._mapping[str(name)] = code
         self._case_insensitive_mapping[str(name).lower()] = name
+        self._get_cache.clear()
 
     def get(self, name: str) -> Optional[int]:
         """Return the code mapped to the key."""
-        # the correct casing should be shown when asking the keyboard_layout
-        # for stuff. indexing case insensitive to support old presets.
-        if name not in self._mapping:
+        get_cache = self._get_cache
+        if name in get_cache:
+            return get_cache[name]
+
+        mapping = self._mapping
+        code = mapping.get(name)
+        if code is None:
+            # the correct casing should be shown when asking the keyboard_layout
+            # for stuff. indexing case insensitive to support old presets.
+            lowercase = name if isinstance(name, str) else str(name)
+            if not lowercase.islower():
+                lowercase = lowercase.lower()
+
             # only if not e.g. both "a" and "A" are in the mapping
-            name = self._case_insensitive_mapping.get(str(name).lower())
+            code = mapping.get(self._case_insensitive_mapping.get(lowercase))
 
-        return self._mapping.get(name)
+        get_cache[name] = code
+        return code
 
     def clear(self):
         """Remove all mapped keys. Only needed for tests."""
@@ -174,11 +223,13 @@ class KeyboardLayout:
         for key in keys:
             del self._mapping[key]
 
+        self._get_cache.clear()
+
     def get_name(self, code: int):
         """Get the first matching name for the code."""
-        for entry in self._xmodmap:
-            if int(entry[0]) - XKB_KEYCODE_OFFSET == code:
-                return entry[1].split()[0]
+        xmodmap_name = self._xmodmap_names.get(code)
+        if xmodmap_name is not None:
+            return xmodmap_name
 
         # Fall back to the linux constants
         # This is especially important for BTN_LEFT and such
@@ -200,21 +251,6 @@ class KeyboardLayout:
 
         return None
 
-    def _find_legit_mappings(self) -> dict:
-        """From the parsed xmodmap list find usable symbols and their codes."""
-        xmodmap_dict = {}
-        for keycode, names in self._xmodmap:
-            # there might be multiple, like:
-            # keycode  64 = Alt_L Meta_L Alt_L Meta_L
-            # keycode 204 = NoSymbol Alt_L NoSymbol Alt_L
-            # Alt_L should map to code 64. Writing code 204 only works
-            # if a modifier is applied at the same time. So take the first
-            # one.
-            name = names.split()[0]
-            xmodmap_dict[name] = int(keycode) - XKB_KEYCODE_OFFSET
-
-        return xmodmap_dict
-
 
 # TODO DI
 # this mapping represents the xmodmap output, which stays constant
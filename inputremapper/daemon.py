@@ -296,7 +296,9 @@ class Daemon:
             unique identifier used by the groups object
         """
         now = time.time()
-        if now - 10 > self.refreshed_devices_at:
+        if now - 10 > self.refreshed_devices_at and groups.devices_changed():
+            # If /dev/input didn't change, the groups are still up to date and
+            # there is no need to wait and search for them again.
             logger.debug("Refreshing because last info is too old")
             # it may take a bit of time until devices are visible after changes
             time.sleep(0.1)
@@ -485,9 +487,9 @@ class Daemon:
                 xmodmap = json.load(file)
                 logger.debug('Using keycodes from "%s"', xmodmap_path)
 
-                # this creates the keyboard_layout._xmodmap, which we need to do now
-                # otherwise it might be created later which will override the changes
-                # we do here.
+                # this creates the keyboard_layout._xmodmap_names index, which we need
+                # to do now otherwise it might be created later which will override
+                # the changes we do here.
                 # Do we really need to lazyload in the keyboard_layout?
                 # this kind of bug is stupid to track down
                 keyboard_layout.get_name(0)
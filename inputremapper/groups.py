@@ -33,10 +33,11 @@ from __future__ import annotations
 import asyncio
 import enum
 import json
-import multiprocessing
 import os
+import queue
 import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 import evdev
@@ -58,6 +59,8 @@ from inputremapper.configs.paths import PathUtils
 from inputremapper.logging.logger import logger
 from inputremapper.utils import get_device_hash
 
+DEV_INPUT = "/dev/input"
+
 TABLET_KEYS = [
     evdev.ecodes.BTN_STYLUS,
     evdev.ecodes.BTN_TOOL_BRUSH,
@@ -290,7 +293,7 @@ class _Group:
         """
         # There might be multiple groups with the same name here when two
         # similar devices are connected to the computer.
-        self.name: str = sorted(names, key=len)[0]
+        self.name: str = min(names, key=len)
 
         self.key = key
 
@@ -332,6 +335,25 @@ class _Group:
         return f"<Group ({self.key}) at {hex(id(self))}>"
 
 
+def _open_device(path: str) -> Optional[evdev.InputDevice]:
+    """Open the device at the path, or log why that failed and return None."""
+    try:
+        return evdev.InputDevice(path)
+    except Exception as error:
+        # Observed exceptions in journalctl:
+        # - "SystemError: <built-in function ioctl_EVIOCGVERSION> returned NULL
+        # without setting an error"
+        # - "FileNotFoundError: [Errno 2] No such file or directory:
+        # '/dev/input/event12'"
+        logger.error(
+            'Failed to access path "%s": %s %s',
+            path,
+            error.__class__.__name__,
+            str(error),
+        )
+        return None
+
+
 class _FindGroups(threading.Thread):
     """Thread to get the devices that can be worked with.
 
@@ -340,15 +362,15 @@ class _FindGroups(threading.Thread):
     slowing down the initialization.
     """
 
-    def __init__(self, pipe: multiprocessing.Pipe):
-        """Construct the process.
+    def __init__(self, result_queue: queue.Queue):
+        """Construct the thread.
 
         Parameters
         ----------
-        pipe
+        result_queue
             used to communicate the result
         """
-        self.pipe = pipe
+        self.result_queue = result_queue
         super().__init__()
 
     def run(self):
@@ -376,33 +398,30 @@ class _FindGroups(threading.Thread):
         #   device breaks autoloading. Sorting fixes it.
         # With sorting, mouse1 always gets group.key "Mouse", and mouse2 always
         # "Mouse 2" (Unless only mouse2 is plugged in, then it gets "Mouse")
-        for path in sorted(evdev.list_devices()):
-            try:
-                device = evdev.InputDevice(path)
-            except Exception as error:
-                # Observed exceptions in journalctl:
-                # - "SystemError: <built-in function ioctl_EVIOCGVERSION> returned NULL
-                # without setting an error"
-                # - "FileNotFoundError: [Errno 2] No such file or directory:
-                # '/dev/input/event12'"
-                logger.error(
-                    'Failed to access path "%s": %s %s',
-                    path,
-                    error.__class__.__name__,
-                    str(error),
-                )
+        paths = sorted(evdev.list_devices())
+
+        # Opening a device blocks for a few syscalls and ioctls, overlap them.
+        # map keeps the order of the paths.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            devices = list(executor.map(_open_device, paths))
+
+        for path, device in zip(paths, devices):
+            if device is None:
                 continue
 
             if device.name == "Power Button":
+                device.close()
                 continue
 
             if is_inputremapper_device(device):
                 logger.debug('Skipping input-remapper device "%s"', device.name)
+                device.close()
                 continue
 
             device_type = classify(device)
 
             if device_type == DeviceType.CAMERA:
+                device.close()
                 continue
 
             # https://www.kernel.org/doc/html/latest/input/event-codes.html
@@ -415,10 +434,12 @@ class _FindGroups(threading.Thread):
             if key_capa is None and abs_capa is None and rel_capa is None:
                 # skip devices that don't provide buttons or axes that can be mapped
                 logger.debug('"%s" has no useful capabilities', device.name)
+                device.close()
                 continue
 
             if is_denylisted(device):
                 logger.debug('"%s" is denylisted', device.name)
+                device.close()
                 continue
 
             key = get_unique_key(device)
@@ -444,7 +465,7 @@ class _FindGroups(threading.Thread):
             devs = [entry[1] for entry in group]
 
             # generate a human readable key
-            shortest_name = sorted(names, key=len)[0]
+            shortest_name = min(names, key=len)
             key = shortest_name
             i = 2
             while key in used_keys:
@@ -464,18 +485,29 @@ class _FindGroups(threading.Thread):
 
             result.append(group.dumps())
 
-        self.pipe.send(json.dumps(result))
+        self.result_queue.put(json.dumps(result))
         loop.close()  # avoid resource allocation warnings
-        # now that everything is sent via the pipe, the InputDevice
+        # now that everything is put into the queue, the InputDevice
         # destructors can go on and take ages to complete in the thread
         # without blocking anything
 
 
+def _get_dev_input_mtime() -> Optional[int]:
+    """Get the modification time of /dev/input, which changes when devices are
+    added or removed."""
+    try:
+        return os.stat(DEV_INPUT).st_mtime_ns
+    except OSError:
+        return None
+
+
 class _Groups:
     """Contains and manages all groups."""
 
     def __init__(self):
         self._groups: List[_Group] = None
+        # /dev/input mtime at the time of the last refresh
+        self._dev_input_mtime: Optional[int] = None
 
     def refresh(self):
         """Look for devices and group them together.
@@ -484,10 +516,13 @@ class _Groups:
         result is cached. Use refresh_groups if you need up to date
         devices.
         """
-        pipe = multiprocessing.Pipe()
-        _FindGroups(pipe[1]).start()
+        # Read it before looking for devices, so that changes that happen while
+        # searching are noticed by devices_changed afterwards.
+        self._dev_input_mtime = _get_dev_input_mtime()
+        result_queue: queue.Queue = queue.Queue()
+        _FindGroups(result_queue).start()
         # block until groups are available
-        message = pipe[0].recv()
+        message = result_queue.get()
         self.loads(message)
 
         if len(self._groups) == 0:
@@ -498,6 +533,14 @@ class _Groups:
             keys = [f'"{group.key}"' for group in self._groups]
             logger.info("Found %s", ", ".join(keys))
 
+    def devices_changed(self) -> bool:
+        """Check if devices were added or removed since the last refresh.
+
+        If this can't be determined, it is assumed that they were.
+        """
+        mtime = _get_dev_input_mtime()
+        return mtime is None or mtime != self._dev_input_mtime
+
     def get_groups(self) -> List[_Group]:
         """Load groups and return them."""
         if self._groups is None:
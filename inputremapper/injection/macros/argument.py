@@ -101,6 +101,11 @@ class Argument(ArgumentConfig):
         self.default = argument_config.default
         self.is_variable_name = argument_config.is_variable_name
 
+        # Dynamic values are checked against the types each time they are used while
+        # the macro runs, so do most of the work once beforehand.
+        self._allowed_types = frozenset(self.types)
+        self._allows_str = str in self._allowed_types
+
         self._mapping = mapping
         self._variables = []
 
@@ -278,13 +283,13 @@ class Argument(ArgumentConfig):
             self.assert_is_symbol(value)
             return value
 
-        if None in self.types and value is None:
+        if type(value) in self._allowed_types:
             return value
 
-        if type(value) in self.types:
+        if value is None and None in self._allowed_types:
             return value
 
-        if type(value) not in self.types and str in self.types:
+        if self._allows_str:
             # `set` cannot make predictions where the variable will be used. Make sure
             # the type is compatible, and turn numbers back into strings if need be.
             return str(value)
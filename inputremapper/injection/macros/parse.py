@@ -22,8 +22,10 @@
 
 from __future__ import annotations
 
+import logging
 import re
-from typing import Optional, Any, Type, TYPE_CHECKING, Dict, List
+from functools import lru_cache
+from typing import Optional, Any, Type, TYPE_CHECKING, Dict, List, Tuple
 
 from inputremapper.configs.validation_errors import MacroError
 from inputremapper.injection.macros.macro import Macro
@@ -57,6 +59,13 @@ if TYPE_CHECKING:
     from inputremapper.injection.context import Context
     from inputremapper.configs.mapping import Mapping
 
+# The macro parser runs for each change while editing macros, so its patterns are
+# only compiled once.
+_KEYWORD_ARG = re.compile(r"[a-zA-Z_][a-zA-Z_\d]*=.+")
+_TASK_CALL = re.compile(r"^(\w+)\(")
+_NAME_START = re.compile(r"[a-zA-Z_]")
+_WHITESPACE = re.compile(r"\s")
+
 
 class Parser:
     TASK_CLASSES: dict[str, type[Task]] = {
@@ -109,7 +118,7 @@ class Parser:
         return "(" in output and ")" in output and len(output) >= 4
 
     @staticmethod
-    def _extract_args(inner: str):
+    def _extract_args(inner: str) -> List[str]:
         """Extract parameters from the inner contents of a call.
 
         This does not parse them.
@@ -119,6 +128,12 @@ class Parser:
         inner
             for example '1, r, r(2, k(a))' should result in ['1', 'r', 'r(2, k(a))']
         """
+        return list(Parser._extract_args_cached(inner))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_args_cached(inner: str) -> Tuple[str, ...]:
+        """Like _extract_args, but immutable so that the result can be cached."""
         inner = inner.strip()
         brackets = 0
         params = []
@@ -146,7 +161,7 @@ class Parser:
         # one last parameter
         params.append(inner[start:].strip())
 
-        return params
+        return tuple(params)
 
     @staticmethod
     def _count_brackets(macro):
@@ -180,7 +195,7 @@ class Parser:
 
         If not a keyward param, return None and the param.
         """
-        if re.match(r"[a-zA-Z_][a-zA-Z_\d]*=.+", param):
+        if _KEYWORD_ARG.match(param):
             split = param.split("=", 1)
             return split[0], split[1]
 
@@ -243,7 +258,7 @@ class Parser:
         code = code.strip()
 
         # is it another macro?
-        task_call_match = re.match(r"^(\w+)\(", code)
+        task_call_match = _TASK_CALL.match(code)
         task_name = task_call_match[1] if task_call_match else None
 
         if task_name is None:
@@ -344,7 +359,7 @@ class Parser:
                     macro_instance,
                     depth,
                 )
-            elif re.match(r"[a-zA-Z_]", next_char):
+            elif _NAME_START.match(next_char):
                 # something like foo()bar
                 raise MacroError(
                     code,
@@ -395,14 +410,18 @@ class Parser:
         logger.debug('Transformed "%s" to "%s"', macro, output)
         return output
 
+    # The gui parses macros on each change to validate them, and the same child
+    # macros and parameters appear repeatedly, so those pure string operations are
+    # cached.
     @staticmethod
+    @lru_cache(maxsize=4096)
     def remove_whitespaces(macro, delimiter='"'):
         """Remove whitespaces, tabs, newlines and such outside of string quotes."""
         result = ""
         for i, chunk in enumerate(macro.split(delimiter)):
             # every second chunk is inside string quotes
             if i % 2 == 0:
-                result += re.sub(r"\s", "", chunk)
+                result += _WHITESPACE.sub("", chunk)
             else:
                 result += chunk
             result += delimiter
@@ -411,6 +430,7 @@ class Parser:
         return result[: -len(delimiter)]
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def remove_comments(macro):
         """Remove comments from the macro and return the resulting code."""
         # keep hashtags inside quotes intact
@@ -464,6 +484,9 @@ class Parser:
         macro = Parser.clean(macro)
         macro = Parser.handle_plus_syntax(macro)
 
+        # Skip the logging of each recursion step entirely if it wouldn't be shown
+        verbose = verbose and logger.isEnabledFor(logging.DEBUG)
+
         macro_obj = Parser._parse_recurse(
             macro,
             context,
@@ -24,6 +24,8 @@ from typing import Any
 from inputremapper.configs.validation_errors import MacroError
 from inputremapper.injection.macros.macro import macro_variables
 
+_VARIABLE_NAME = re.compile(r"^[A-Za-z_][A-Za-z_0-9]*$")
+
 
 class Variable:
     """Something that the user passed into a macro function as parameter.
@@ -75,9 +77,7 @@ class Variable:
         Allowed examples: "foo", "Foo1234_", "_foo_1234"
         Not allowed: "1_foo", "foo=blub", "$foo", "foo,1234", "foo()"
         """
-        if not isinstance(self.value, str) or not re.match(
-            r"^[A-Za-z_][A-Za-z_0-9]*$", self.value
-        ):
+        if not isinstance(self.value, str) or not _VARIABLE_NAME.match(self.value):
             raise MacroError(msg=f'"{self.value}" is not a legit variable name')
 
     def __repr__(self) -> str:
@@ -43,11 +43,14 @@ class CombinationHandler(MappingHandler):
 
     # map of InputEvent.input_match_hash -> bool , keep track of the combination state
     _pressed_keys: Dict[Hashable, bool]
+    # how many values in _pressed_keys are True, so that checking if the combination
+    # is activated doesn't require iterating over all of them for each event
+    _num_pressed: int
     # the last update we sent to a sub-handler. If this is true, the output key is
     # still being held down.
     _output_previously_active: bool
     _sub_handler: MappingHandler
-    _handled_input_hashes: list[Hashable]
+    _handled_input_hashes: frozenset[Hashable]
     _requires_a_release: Dict[Tuple[int, int], bool]
 
     def __init__(
@@ -61,6 +64,7 @@ class CombinationHandler(MappingHandler):
         logger.debug(str(mapping))
         super().__init__(combination, mapping, global_uinputs)
         self._pressed_keys = {}
+        self._num_pressed = 0
         self._output_previously_active = False
         self._context = context
         self._requires_a_release = {}
@@ -70,9 +74,9 @@ class CombinationHandler(MappingHandler):
             assert not input_config.defines_analog_input
             self._pressed_keys[input_config.input_match_hash] = False
 
-        self._handled_input_hashes = [
+        self._handled_input_hashes = frozenset(
             input_config.input_match_hash for input_config in combination
-        ]
+        )
 
         assert len(self._pressed_keys) > 0  # no combination handler without a key
 
@@ -106,6 +110,8 @@ class CombinationHandler(MappingHandler):
         # The value of non-key input should have been changed to either 0 or 1 at this
         # point by other handlers.
         is_pressed = event.is_pressed()
+        previously_pressed = self._pressed_keys[event.input_match_hash]
+        self._num_pressed += int(is_pressed) - int(previously_pressed)
         self._pressed_keys[event.input_match_hash] = is_pressed
         # maybe this changes the activation status (triggered/not-triggered)
         changed = self._is_activated() != self._output_previously_active
@@ -153,12 +159,10 @@ class CombinationHandler(MappingHandler):
         # Send key up events to the forwarded uinput if configured to do so.
         self._forward_release()
 
-        logger.debug(
-            "Sending %s to sub-handler %s",
-            repr(event),
-            repr(self._sub_handler),
-        )
-        self._output_previously_active = event.is_pressed()
+        # %r defers the repr calls until the message is actually logged
+        logger.debug("Sending %r to sub-handler %r", event, self._sub_handler)
+        # Only called for key-down events
+        self._output_previously_active = True
         sub_handler_result = self._sub_handler.notify(event, source, suppress)
 
         # Only if the sub-handler return False, we need a release-event later.
@@ -177,12 +181,10 @@ class CombinationHandler(MappingHandler):
         # In the case of output axis, this will enable us to activate multiple
         # axis with the same button.
 
-        logger.debug(
-            "Sending %s to sub-handler %s",
-            repr(event),
-            repr(self._sub_handler),
-        )
-        self._output_previously_active = event.is_pressed()
+        # %r defers the repr calls until the message is actually logged
+        logger.debug("Sending %r to sub-handler %r", event, self._sub_handler)
+        # Only called for key-up events
+        self._output_previously_active = False
         self._sub_handler.notify(event, source, suppress=False)
 
         # Negate: `False` means that the event-reader will forward the release.
@@ -211,15 +213,18 @@ class CombinationHandler(MappingHandler):
         self._requires_a_release[event.type_and_code] = require
 
     def reset(self) -> None:
-        self._sub_handler.reset()
+        # Reset our own state first, so that it is consistent even if the
+        # sub-handler fails to reset.
         for key in self._pressed_keys:
             self._pressed_keys[key] = False
-        self._requires_a_release = {}
+        self._num_pressed = 0
+        self._requires_a_release.clear()
         self._output_previously_active = False
+        self._sub_handler.reset()
 
     def _is_activated(self) -> bool:
         """Return if all keys in the keymap are set to True."""
-        return False not in self._pressed_keys.values()
+        return self._num_pressed == len(self._pressed_keys)
 
     def _forward_release(self) -> None:
         """Forward a button release for all keys if this is a combination.
@@ -229,14 +234,16 @@ class CombinationHandler(MappingHandler):
         if len(self._pressed_keys) == 1 or not self.mapping.release_combination_keys:
             return
 
-        keys_to_release = filter(
-            lambda cfg: self._pressed_keys.get(cfg.input_match_hash),
-            self.mapping.input_combination,
-        )
+        if not self._requires_a_release:
+            # None of the keys were forwarded, so there is nothing to release
+            return
 
         logger.debug("Forwarding release for %s", self.mapping.input_combination)
 
-        for input_config in keys_to_release:
+        for input_config in self.mapping.input_combination:
+            if not self._pressed_keys.get(input_config.input_match_hash):
+                continue
+
             if not self._requires_a_release.get(input_config.type_and_code):
                 continue
 
@@ -264,12 +271,10 @@ class CombinationHandler(MappingHandler):
         )
 
     def wrap_with(self) -> Dict[InputCombination, HandlerEnums]:
-        return_dict = {}
-        for config in self.input_configs:
-            if config.type == EV_ABS and not config.defines_analog_input:
-                return_dict[InputCombination([config])] = HandlerEnums.abs2btn
-
-            if config.type == EV_REL and not config.defines_analog_input:
-                return_dict[InputCombination([config])] = HandlerEnums.rel2btn
-
-        return return_dict
+        return {
+            InputCombination([config]): (
+                HandlerEnums.abs2btn if config.type == EV_ABS else HandlerEnums.rel2btn
+            )
+            for config in self.input_configs
+            if config.type in (EV_ABS, EV_REL) and not config.defines_analog_input
+        }
@@ -37,8 +37,9 @@ class EventActions(enum.Enum):
     none = enum.auto()
 
 
-# Todo: add slots=True as soon as python 3.10 is in common distros
-@dataclass(frozen=True)
+# Slots avoid a __dict__ for each of the many events that are created while
+# injecting, which makes them smaller and faster to create.
+@dataclass(frozen=True, slots=True)
 class InputEvent:
     """Events that are generated during runtime.
 
@@ -110,6 +110,10 @@ class InputDevice:
     def ungrab(self):
         logger.info("ungrab %s %s", self.name, self.path)
 
+    def close(self):
+        # the fd belongs to the pipe of the fixture, which stays open
+        pass
+
     async def async_read_loop(self):
         logger.info("starting read loop for %s", self.path)
         new_frame = asyncio.Event()
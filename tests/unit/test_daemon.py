@@ -28,6 +28,7 @@ import evdev
 from evdev._ecodes import EV_ABS
 from evdev.ecodes import EV_KEY, KEY_B, KEY_A, ABS_X, BTN_A, BTN_B
 
+from inputremapper import groups as groups_module
 from inputremapper.configs.global_config import GlobalConfig
 from inputremapper.configs.input_config import InputCombination, InputConfig
 from inputremapper.configs.mapping import Mapping
@@ -309,6 +310,34 @@ class TestDaemon(unittest.TestCase):
         # test if the injector called groups.refresh successfully
         self.assertIsNotNone(groups.find(name=device_9876))
 
+    def test_refresh_if_dev_input_changed(self):
+        dev_input = os.path.join(tmp, "dev_input")
+        os.makedirs(dev_input, exist_ok=True)
+        with patch.object(groups_module, "DEV_INPUT", dev_input):
+            os.utime(dev_input, ns=(1000, 1000))
+            self.daemon = Daemon(
+                self.global_config,
+                self.global_uinputs,
+                self.mapping_parser,
+            )
+            groups.refresh()
+            group_key = groups.find(name="Bar Device").key
+
+            # The last info is too old, but /dev/input didn't change and the group is
+            # known, so there is no need to search for devices again
+            self.daemon.refreshed_devices_at = 0
+            with patch.object(groups, "refresh") as refresh_mock:
+                self.daemon.refresh(group_key)
+                refresh_mock.assert_not_called()
+
+            # a device was plugged in
+            os.utime(dev_input, ns=(2000, 2000))
+            with patch.object(groups, "refresh") as refresh_mock:
+                self.daemon.refresh(group_key)
+                refresh_mock.assert_called_once()
+
+            self.assertGreater(self.daemon.refreshed_devices_at, 0)
+
     def test_xmodmap_file(self):
         """Create a custom xmodmap file, expect the daemon to read keycodes from it."""
         from_keycode = evdev.ecodes.KEY_A
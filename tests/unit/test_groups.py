@@ -20,10 +20,13 @@
 
 import json
 import os
+import queue
 import unittest
+from unittest.mock import patch
 
 import evdev
 
+from inputremapper import groups as groups_module
 from inputremapper.configs.paths import PathUtils
 from inputremapper.groups import (
     _FindGroups,
@@ -35,13 +38,7 @@ from inputremapper.groups import (
 )
 from tests.lib.fixtures import fixtures, keyboard_keys, Fixture
 from tests.lib.test_setup import test_setup
-
-
-class FakePipe:
-    groups = None
-
-    def send(self, groups):
-        self.groups = groups
+from tests.lib.tmp import tmp
 
 
 @test_setup
@@ -66,11 +63,12 @@ class TestGroups(unittest.TestCase):
         )
 
     def test_find_groups(self):
-        pipe = FakePipe()
-        _FindGroups(pipe).run()
-        self.assertIsInstance(pipe.groups, str)
+        result_queue = queue.Queue()
+        _FindGroups(result_queue).run()
+        found_groups = result_queue.get_nowait()
+        self.assertIsInstance(found_groups, str)
 
-        groups.loads(pipe.groups)
+        groups.loads(found_groups)
         self.maxDiff = None
         dump1 = groups.dumps()
         dump2 = json.dumps(
@@ -143,7 +141,26 @@ class TestGroups(unittest.TestCase):
         self.assertEqual(dump1, dump2)
 
         groups2 = json.dumps([group.dumps() for group in groups.get_groups()])
-        self.assertEqual(pipe.groups, groups2)
+        self.assertEqual(found_groups, groups2)
+
+    def test_devices_changed(self):
+        dev_input = os.path.join(tmp, "dev_input")
+        os.makedirs(dev_input, exist_ok=True)
+        with patch.object(groups_module, "DEV_INPUT", dev_input):
+            os.utime(dev_input, ns=(1000, 1000))
+            groups.refresh()
+            self.assertFalse(groups.devices_changed())
+
+            # a device was plugged in
+            os.utime(dev_input, ns=(2000, 2000))
+            self.assertTrue(groups.devices_changed())
+
+            groups.refresh()
+            self.assertFalse(groups.devices_changed())
+
+        # can't tell if /dev/input doesn't exist
+        with patch.object(groups_module, "DEV_INPUT", os.path.join(tmp, "foo")):
+            self.assertTrue(groups.devices_changed())
 
     def test_list_group_names(self):
         self.assertListEqual(
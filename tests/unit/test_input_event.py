@@ -70,14 +70,12 @@ class TestInputEvent(unittest.TestCase):
         )
         self.assertEqual(e1.type_and_code, (evdev.ecodes.EV_KEY, evdev.ecodes.BTN_LEFT))
 
-        with self.assertRaises(
-            FrozenInstanceError
-        ):  # would be TypeError on a slotted class
+        # Depending on the python version, the slotted dataclass raises a TypeError
+        # instead of a FrozenInstanceError for properties.
+        with self.assertRaises((FrozenInstanceError, TypeError)):
             e1.event_tuple = (1, 2, 3)
 
-        with self.assertRaises(
-            FrozenInstanceError
-        ):  # would be TypeError on a slotted class
+        with self.assertRaises((FrozenInstanceError, TypeError)):
             e1.type_and_code = (1, 2)
 
         with self.assertRaises(FrozenInstanceError):
@@ -20,8 +20,13 @@
 
 
 import asyncio
+import selectors
+import sys
 import unittest
+from collections import Counter
+from typing import Callable, Iterator
 
+from inputremapper.configs.keyboard_layout import keyboard_layout
 from inputremapper.configs.preset import Preset
 from inputremapper.configs.validation_errors import MacroError
 from inputremapper.injection.context import Context
@@ -34,24 +39,102 @@ from tests.lib.logger import logger
 from tests.lib.patches import InputDevice
 
 
+class _TimeSkippingSelector(selectors.DefaultSelector):
+    def __init__(self, loop: "VirtualClockEventLoop"):
+        super().__init__()
+        self._loop = loop
+
+    def select(self, timeout=None):
+        if timeout is None or timeout <= 0:
+            return super().select(timeout)
+
+        # Instead of waiting for the next timer, pretend that the time has passed
+        events = super().select(0)
+        if not events:
+            self._loop.advance_time(timeout)
+
+        return events
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """An event loop that jumps to the next timer instead of waiting for it.
+
+    Sleeps and timeouts finish right away, while their order is the same as on a real
+    loop. Not for tests that measure how long things take in real time.
+    """
+
+    def __init__(self):
+        self._virtual_time = 0.0
+        super().__init__(_TimeSkippingSelector(self))
+
+    def time(self) -> float:
+        return self._virtual_time
+
+    def advance_time(self, seconds: float) -> None:
+        self._virtual_time += seconds
+
+
+class _VirtualClockEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    def new_event_loop(self):
+        return VirtualClockEventLoop()
+
+
+class _KeyCode:
+    """Look up the code of a key only when a test uses it.
+
+    Not when the class is set up, because classes without @test_setup would then
+    populate the unpatched keyboard_layout, running the real xmodmap.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __get__(self, instance, owner) -> int:
+        # Cached by keyboard_layout
+        return keyboard_layout.get(self._name)
+
+
 class MacroTestBase(unittest.IsolatedAsyncioTestCase):
+    # Run the tests on a VirtualClockEventLoop, for tests that only depend on the
+    # order of timed events
+    virtual_clock = False
+
+    code_a = _KeyCode("a")
+    code_b = _KeyCode("b")
+    code_c = _KeyCode("c")
+    code_d = _KeyCode("d")
+    code_x = _KeyCode("x")
+    code_y = _KeyCode("y")
+    code_1 = _KeyCode("1")
+    code_3 = _KeyCode("3")
+    code_shift = _KeyCode("KEY_LEFTSHIFT")
+
     @classmethod
     def setUpClass(cls):
+        if cls.virtual_clock:
+            if sys.version_info >= (3, 13):
+                cls.loop_factory = VirtualClockEventLoop
+            else:
+                # IsolatedAsyncioTestCase.loop_factory is new in Python 3.13
+                asyncio.set_event_loop_policy(_VirtualClockEventLoopPolicy())
+                # Unlike tearDownClass, this also runs if setUpClass fails
+                cls.addClassCleanup(asyncio.set_event_loop_policy, None)
+
         macro_variables.start()
 
+        # Macros don't use them to inject anything, so they don't carry state from
+        # one test to the next and can be shared.
+        cls.global_uinputs = GlobalUInputs(UInput)
+        cls.mapping_parser = MappingParser(cls.global_uinputs)
+
     def setUp(self):
+        # IsolatedAsyncioTestCase already runs each test in its own event loop
         self.result = []
-        self.global_uinputs = GlobalUInputs(UInput)
-        self.mapping_parser = MappingParser(self.global_uinputs)
-
-        try:
-            self.loop = asyncio.get_event_loop()
-        except RuntimeError:
-            # suddenly "There is no current event loop in thread 'MainThread'"
-            # errors started to appear
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
+        # How often each event was written, without counting through the whole result
+        self.result_counts = Counter()
+        self.result_written = asyncio.Event()
 
+        # Not shared, because the pipe of the fixture is replaced after each test
         self.source_device = InputDevice(fixtures.bar_device.path)
 
         self.context = Context(
@@ -62,12 +145,20 @@ class MacroTestBase(unittest.IsolatedAsyncioTestCase):
         )
 
     def tearDown(self):
-        self.result = []
+        self.reset_result()
+
+    def reset_result(self):
+        """Forget what the macros wrote so far, including the counts."""
+        self.result.clear()
+        self.result_counts.clear()
 
     def handler(self, type_: int, code: int, value: int):
         """Where macros should write codes to."""
-        logger.info(f"macro wrote{(type_, code, value)}")
-        self.result.append((type_, code, value))
+        event = (type_, code, value)
+        logger.info("macro wrote%s", event)
+        self.result.append(event)
+        self.result_counts[event] += 1
+        self.result_written.set()
 
     async def trigger_sequence(self, macro: Macro, event):
         for listener in self.context.listeners:
@@ -80,6 +171,14 @@ class MacroTestBase(unittest.IsolatedAsyncioTestCase):
             return
         asyncio.ensure_future(macro.run(self.handler))
 
+    def broadcast(self, event) -> asyncio.Future:
+        """Pass the event to all listeners, without waiting for them.
+
+        Each listener still runs in its own task. Await the returned future to wait
+        for all of them.
+        """
+        return asyncio.gather(*(listener(event) for listener in self.context.listeners))
+
     async def release_sequence(self, macro: Macro, event):
         for listener in self.context.listeners:
             asyncio.ensure_future(listener(event))
@@ -88,20 +187,35 @@ class MacroTestBase(unittest.IsolatedAsyncioTestCase):
 
         macro.release_trigger()
 
+    async def wait_until(self, condition: Callable[[], bool], timeout: float = 1.0):
+        """Wait until the condition about self.result is met.
+
+        It is checked again each time a macro writes to the handler. Faster than
+        sleeping for a fixed time that is long enough for slow machines.
+        """
+
+        async def wait():
+            while not condition():
+                self.result_written.clear()
+                await self.result_written.wait()
+
+        await asyncio.wait_for(wait(), timeout)
+
+    def iterate_macros(self, macro) -> Iterator[Macro]:
+        """Yield the macro and all of its child macros, no matter how deep."""
+        stack = [macro]
+        while stack:
+            macro = stack.pop()
+            yield macro
+            for task in macro.tasks:
+                stack.extend(task.child_macros)
+
     def count_child_macros(self, macro) -> int:
-        count = 0
-        for task in macro.tasks:
-            count += len(task.child_macros)
-            for child_macro in task.child_macros:
-                count += self.count_child_macros(child_macro)
-        return count
+        # all macros in the tree, except for the root
+        return sum(1 for _ in self.iterate_macros(macro)) - 1
 
     def count_tasks(self, macro) -> int:
-        count = len(macro.tasks)
-        for task in macro.tasks:
-            for child_macro in task.child_macros:
-                count += self.count_tasks(child_macro)
-        return count
+        return sum(len(child.tasks) for child in self.iterate_macros(macro))
 
     def expect_string_in_error(self, string: str, macro: str):
         with self.assertRaises(MacroError) as cm:
@@ -19,6 +19,7 @@
 # along with input-remapper.  If not, see <https://www.gnu.org/licenses/>.
 
 
+import asyncio
 import unittest
 
 from inputremapper.configs.validation_errors import MacroError
@@ -31,22 +32,18 @@ from tests.unit.test_macros.macro_test_base import DummyMapping, MacroTestBase
 @test_setup
 class TestAdd(MacroTestBase):
     async def test_add(self):
-        await Parser.parse("set(a, 1).add(a, 1)", self.context, DummyMapping).run(
-            self.handler
-        )
-        self.assertEqual(macro_variables.get("a"), 2)
+        # Each macro uses its own variable, so they can run at the same time
+        macros = [
+            Parser.parse("set(a, 1).add(a, 1)", self.context, DummyMapping),
+            Parser.parse("set(b, 1).add(b, -1)", self.context, DummyMapping),
+            Parser.parse("set(c, -1).add(c, 500)", self.context, DummyMapping),
+            Parser.parse("add(d, 500)", self.context, DummyMapping),
+        ]
+        await asyncio.gather(*(macro.run(self.handler) for macro in macros))
 
-        await Parser.parse("set(b, 1).add(b, -1)", self.context, DummyMapping).run(
-            self.handler
-        )
+        self.assertEqual(macro_variables.get("a"), 2)
         self.assertEqual(macro_variables.get("b"), 0)
-
-        await Parser.parse("set(c, -1).add(c, 500)", self.context, DummyMapping).run(
-            self.handler
-        )
         self.assertEqual(macro_variables.get("c"), 499)
-
-        await Parser.parse("add(d, 500)", self.context, DummyMapping).run(self.handler)
         self.assertEqual(macro_variables.get("d"), 500)
 
     async def test_add_invalid(self):
@@ -20,6 +20,8 @@
 
 
 import unittest
+from functools import lru_cache
+from typing import Optional, Tuple, Type
 
 from inputremapper.configs.validation_errors import (
     MacroError,
@@ -32,6 +34,21 @@ from inputremapper.injection.macros.task import Task
 from tests.unit.test_macros.macro_test_base import DummyMapping, MacroTestBase
 
 
+@lru_cache(maxsize=None)
+def _test_task_class(types: Tuple[Optional[Type], ...]) -> Type[Task]:
+    # Each combination of types only needs its class to be created once
+    class TestTask(Task):
+        argument_configs = [
+            ArgumentConfig(
+                name="testvalue",
+                position=0,
+                types=list(types),
+            )
+        ]
+
+    return TestTask
+
+
 class TestDynamicTypes(MacroTestBase):
     # "Dynamic" meaning const=False
     async def test_set_type_int(self):
@@ -64,17 +81,9 @@ class TestDynamicTypes(MacroTestBase):
         self.assertEqual(macro_variables.get("a"), "3")
 
     def make_test_task(self, types):
-        # Make a new test task, with a different types array each time.
-        class TestTask(Task):
-            argument_configs = [
-                ArgumentConfig(
-                    name="testvalue",
-                    position=0,
-                    types=types,
-                )
-            ]
-
-        return TestTask(
+        # Make a new test task instance. Its class is cached per tuple of types, so
+        # each types combination shares the same class.
+        return _test_task_class(tuple(types))(
             [RawValue("$a")],
             {},
             self.context,
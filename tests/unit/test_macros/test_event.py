@@ -27,7 +27,6 @@ from evdev.ecodes import (
     REL_X,
 )
 
-from inputremapper.configs.keyboard_layout import keyboard_layout
 from inputremapper.injection.macros.parse import Parser
 from tests.lib.test_setup import test_setup
 from tests.unit.test_macros.macro_test_base import MacroTestBase, DummyMapping
@@ -37,10 +36,10 @@ from tests.unit.test_macros.macro_test_base import MacroTestBase, DummyMapping
 class TestEvent(MacroTestBase):
     async def test_event_1(self):
         macro = Parser.parse("e(EV_KEY, KEY_A, 1)", self.context, DummyMapping)
-        a_code = keyboard_layout.get("a")
+        a_code = self.code_a
 
         await macro.run(self.handler)
-        self.assertListEqual(self.result, [(EV_KEY, a_code, 1)])
+        self.assertEqual(self.result, [(EV_KEY, a_code, 1)])
         self.assertEqual(self.count_child_macros(macro), 0)
 
     async def test_event_2(self):
@@ -52,14 +51,14 @@ class TestEvent(MacroTestBase):
         code = 324
 
         await macro.run(self.handler)
-        self.assertListEqual(self.result, [(5421, code, 154)])
+        self.assertEqual(self.result, [(5421, code, 154)])
         self.assertEqual(self.count_child_macros(macro), 1)
 
     async def test_event_mouse(self):
         macro = Parser.parse("e(EV_REL, REL_X, 10)", self.context, DummyMapping)
 
         await macro.run(self.handler)
-        self.assertListEqual(self.result, [(EV_REL, REL_X, 10)])
+        self.assertEqual(self.result, [(EV_REL, REL_X, 10)])
         self.assertEqual(self.count_child_macros(macro), 0)
 
 
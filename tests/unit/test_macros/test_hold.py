@@ -24,7 +24,6 @@ import unittest
 
 from evdev.ecodes import EV_KEY
 
-from inputremapper.configs.keyboard_layout import keyboard_layout
 from inputremapper.configs.validation_errors import MacroError
 from inputremapper.injection.macros.parse import Parser
 from tests.lib.test_setup import test_setup
@@ -40,26 +39,32 @@ class TestHold(MacroTestBase):
         """down"""
 
         macro.press_trigger()
-        await asyncio.sleep(0.05)
         self.assertTrue(macro.tasks[1].is_holding())
 
-        macro.press_trigger()  # redundantly calling doesn't break anything
+        code_1 = self.code_1
+        code_a = self.code_a
+        code_3 = self.code_3
+
         asyncio.ensure_future(macro.run(self.handler))
-        await asyncio.sleep(0.2)
+        # key(1) and 3 repetitions of key(a)
+        await self.wait_until(lambda: len(self.result) >= 8)
         self.assertTrue(macro.tasks[1].is_holding())
-        self.assertGreater(len(self.result), 2)
+        self.assertEqual(
+            self.result[:8],
+            [(EV_KEY, code_1, 1), (EV_KEY, code_1, 0)]
+            + [(EV_KEY, code_a, 1), (EV_KEY, code_a, 0)] * 3,
+        )
 
         """up"""
 
         macro.release_trigger()
-        await asyncio.sleep(0.05)
+        await self.wait_until(lambda: self.result[-1] == (EV_KEY, code_3, 0))
         self.assertFalse(macro.tasks[1].is_holding())
 
-        self.assertEqual(self.result[0], (EV_KEY, keyboard_layout.get("1"), 1))
-        self.assertEqual(self.result[-1], (EV_KEY, keyboard_layout.get("3"), 0))
+        self.assertEqual(self.result[0], (EV_KEY, code_1, 1))
+        self.assertEqual(self.result[-1], (EV_KEY, code_3, 0))
 
-        code_a = keyboard_layout.get("a")
-        self.assertGreater(self.result.count((EV_KEY, code_a, 1)), 2)
+        self.assertGreater(self.result_counts[(EV_KEY, code_a, 1)], 2)
 
         self.assertEqual(self.count_child_macros(macro), 1)
         self.assertEqual(self.count_tasks(macro), 4)
@@ -84,20 +89,25 @@ class TestHold(MacroTestBase):
         self.assertFalse(macro.running)
 
     async def test_dont_hold(self):
-        macro = Parser.parse("key(1).hold(key(a)).key(3)", self.context, DummyMapping)
-
-        asyncio.ensure_future(macro.run(self.handler))
-        await asyncio.sleep(0.2)
-        self.assertFalse(macro.tasks[1].is_holding())
-        # press_trigger was never called, so the macro completes right away
-        # and the child macro of hold is never called.
-        self.assertEqual(len(self.result), 4)
-
-        self.assertEqual(self.result[0], (EV_KEY, keyboard_layout.get("1"), 1))
-        self.assertEqual(self.result[-1], (EV_KEY, keyboard_layout.get("3"), 0))
-
-        self.assertEqual(self.count_child_macros(macro), 1)
-        self.assertEqual(self.count_tasks(macro), 4)
+        # press_trigger is never called, so the macros complete right away, and the
+        # child macro of hold is never called.
+        for code, num_child_macros, num_tasks in [
+            ("key(1).hold(key(a)).key(3)", 1, 4),
+            ("key(1).hold().key(3)", 0, 3),
+        ]:
+            with self.subTest(code=code):
+                self.reset_result()
+                macro = Parser.parse(code, self.context, DummyMapping)
+
+                await asyncio.wait_for(macro.run(self.handler), 1)
+                self.assertFalse(macro.tasks[1].is_holding())
+                self.assertEqual(len(self.result), 4)
+
+                self.assertEqual(self.result[0], (EV_KEY, self.code_1, 1))
+                self.assertEqual(self.result[-1], (EV_KEY, self.code_3, 0))
+
+                self.assertEqual(self.count_child_macros(macro), num_child_macros)
+                self.assertEqual(self.count_tasks(macro), num_tasks)
 
     async def test_just_hold(self):
         macro = Parser.parse("key(1).hold().key(3)", self.context, DummyMapping)
@@ -106,7 +116,7 @@ class TestHold(MacroTestBase):
 
         macro.press_trigger()
         asyncio.ensure_future(macro.run(self.handler))
-        await asyncio.sleep(0.1)
+        await self.wait_until(lambda: len(self.result) >= 2)
         self.assertTrue(macro.tasks[1].is_holding())
         self.assertEqual(len(self.result), 2)
         await asyncio.sleep(0.1)
@@ -116,31 +126,16 @@ class TestHold(MacroTestBase):
         """up"""
 
         macro.release_trigger()
-        await asyncio.sleep(0.05)
+        await self.wait_until(lambda: len(self.result) >= 4)
         self.assertFalse(macro.tasks[1].is_holding())
         self.assertEqual(len(self.result), 4)
 
-        self.assertEqual(self.result[0], (EV_KEY, keyboard_layout.get("1"), 1))
-        self.assertEqual(self.result[-1], (EV_KEY, keyboard_layout.get("3"), 0))
+        self.assertEqual(self.result[0], (EV_KEY, self.code_1, 1))
+        self.assertEqual(self.result[-1], (EV_KEY, self.code_3, 0))
 
         self.assertEqual(self.count_child_macros(macro), 0)
         self.assertEqual(self.count_tasks(macro), 3)
 
-    async def test_dont_just_hold(self):
-        macro = Parser.parse("key(1).hold().key(3)", self.context, DummyMapping)
-
-        asyncio.ensure_future(macro.run(self.handler))
-        await asyncio.sleep(0.1)
-        self.assertFalse(macro.tasks[1].is_holding())
-        # since press_trigger was never called it just does the macro
-        # completely
-        self.assertEqual(len(self.result), 4)
-
-        self.assertEqual(self.result[0], (EV_KEY, keyboard_layout.get("1"), 1))
-        self.assertEqual(self.result[-1], (EV_KEY, keyboard_layout.get("3"), 0))
-
-        self.assertEqual(self.count_child_macros(macro), 0)
-
     async def test_hold_down(self):
         # writes down and waits for the up event until the key is released
         macro = Parser.parse("hold(a)", self.context, DummyMapping)
@@ -149,31 +144,51 @@ class TestHold(MacroTestBase):
         """down"""
 
         macro.press_trigger()
-        await asyncio.sleep(0.05)
         self.assertTrue(macro.tasks[0].is_holding())
 
         asyncio.ensure_future(macro.run(self.handler))
-        macro.press_trigger()  # redundantly calling doesn't break anything
-        await asyncio.sleep(0.2)
+        await self.wait_until(lambda: len(self.result) >= 1)
         self.assertTrue(macro.tasks[0].is_holding())
         self.assertEqual(len(self.result), 1)
-        self.assertEqual(self.result[0], (EV_KEY, keyboard_layout.get("a"), 1))
+        self.assertEqual(self.result[0], (EV_KEY, self.code_a, 1))
 
         """up"""
 
         macro.release_trigger()
-        await asyncio.sleep(0.05)
+        await self.wait_until(lambda: len(self.result) >= 2)
         self.assertFalse(macro.tasks[0].is_holding())
 
         self.assertEqual(len(self.result), 2)
-        self.assertEqual(self.result[0], (EV_KEY, keyboard_layout.get("a"), 1))
-        self.assertEqual(self.result[1], (EV_KEY, keyboard_layout.get("a"), 0))
+        self.assertEqual(self.result[0], (EV_KEY, self.code_a, 1))
+        self.assertEqual(self.result[1], (EV_KEY, self.code_a, 0))
+
+    async def test_press_trigger_idempotent(self):
+        # redundantly calling press_trigger doesn't break anything, neither before
+        # nor while the macro is running
+        macro = Parser.parse("key(1).hold(key(a)).key(3)", self.context, DummyMapping)
+        code_1 = self.code_1
+        code_3 = self.code_3
+
+        macro.press_trigger()
+        macro.press_trigger()
+        self.assertTrue(macro.tasks[1].is_holding())
+
+        run = asyncio.ensure_future(macro.run(self.handler))
+        await self.wait_until(lambda: len(self.result) >= 4)
+        macro.press_trigger()
+        self.assertTrue(macro.tasks[1].is_holding())
+
+        macro.release_trigger()
+        await asyncio.wait_for(run, 1)
+        self.assertFalse(macro.tasks[1].is_holding())
+        self.assertEqual(self.result[:2], [(EV_KEY, code_1, 1), (EV_KEY, code_1, 0)])
+        self.assertEqual(self.result[-2:], [(EV_KEY, code_3, 1), (EV_KEY, code_3, 0)])
 
     async def test_hold_variable(self):
-        code_a = keyboard_layout.get("a")
+        code_a = self.code_a
         macro = Parser.parse("set(foo, a).hold($foo)", self.context, DummyMapping)
         await macro.run(self.handler)
-        self.assertListEqual(
+        self.assertEqual(
             self.result,
             [
                 (EV_KEY, code_a, 1),
@@ -24,7 +24,6 @@ import unittest
 
 from evdev.ecodes import EV_KEY
 
-from inputremapper.configs.keyboard_layout import keyboard_layout
 from inputremapper.configs.validation_errors import MacroError
 from inputremapper.injection.macros.parse import Parser
 from tests.lib.test_setup import test_setup
@@ -42,32 +41,28 @@ class TestHoldKeys(MacroTestBase):
         # then run, just like how it is going to happen during runtime
         asyncio.ensure_future(macro.run(self.handler))
 
-        code_a = keyboard_layout.get("a")
-        code_b = keyboard_layout.get("b")
-        code_c = keyboard_layout.get("c")
-
-        await asyncio.sleep(0.2)
-        self.assertListEqual(
+        await self.wait_until(lambda: len(self.result) >= 3)
+        self.assertEqual(
             self.result,
             [
-                (EV_KEY, code_a, 1),
-                (EV_KEY, code_b, 1),
-                (EV_KEY, code_c, 1),
+                (EV_KEY, self.code_a, 1),
+                (EV_KEY, self.code_b, 1),
+                (EV_KEY, self.code_c, 1),
             ],
         )
 
         macro.release_trigger()
 
-        await asyncio.sleep(0.2)
-        self.assertListEqual(
+        await self.wait_until(lambda: len(self.result) >= 6)
+        self.assertEqual(
             self.result,
             [
-                (EV_KEY, code_a, 1),
-                (EV_KEY, code_b, 1),
-                (EV_KEY, code_c, 1),
-                (EV_KEY, code_c, 0),
-                (EV_KEY, code_b, 0),
-                (EV_KEY, code_a, 0),
+                (EV_KEY, self.code_a, 1),
+                (EV_KEY, self.code_b, 1),
+                (EV_KEY, self.code_c, 1),
+                (EV_KEY, self.code_c, 0),
+                (EV_KEY, self.code_b, 0),
+                (EV_KEY, self.code_a, 0),
             ],
         )
 
@@ -81,10 +76,10 @@ class TestHoldKeys(MacroTestBase):
         # then run, just like how it is going to happen during runtime
         asyncio.ensure_future(macro.run(self.handler))
         await asyncio.sleep(0.2)
-        self.assertListEqual(self.result, [])
+        self.assertEqual(self.result, [])
         macro.release_trigger()
         await asyncio.sleep(0.2)
-        self.assertListEqual(self.result, [])
+        self.assertEqual(self.result, [])
 
     async def test_aldjfakl(self):
         repeats = 5
@@ -102,23 +97,23 @@ class TestHoldKeys(MacroTestBase):
 
         macro.press_trigger()
         asyncio.ensure_future(macro.run(self.handler))
-        await asyncio.sleep(0.2)
+        await self.wait_until(lambda: len(self.result) >= 4)
         self.assertTrue(macro.tasks[0].is_holding())
 
         # starting from the left, presses each one down
-        self.assertEqual(self.result[0], (EV_KEY, keyboard_layout.get("a"), 1))
-        self.assertEqual(self.result[1], (EV_KEY, keyboard_layout.get("b"), 1))
-        self.assertEqual(self.result[2], (EV_KEY, keyboard_layout.get("c"), 1))
-        self.assertEqual(self.result[3], (EV_KEY, keyboard_layout.get("d"), 1))
+        self.assertEqual(self.result[0], (EV_KEY, self.code_a, 1))
+        self.assertEqual(self.result[1], (EV_KEY, self.code_b, 1))
+        self.assertEqual(self.result[2], (EV_KEY, self.code_c, 1))
+        self.assertEqual(self.result[3], (EV_KEY, self.code_d, 1))
 
         # and then releases starting with the previously pressed key
         macro.release_trigger()
-        await asyncio.sleep(0.2)
+        await self.wait_until(lambda: len(self.result) >= 8)
         self.assertFalse(macro.tasks[0].is_holding())
-        self.assertEqual(self.result[4], (EV_KEY, keyboard_layout.get("d"), 0))
-        self.assertEqual(self.result[5], (EV_KEY, keyboard_layout.get("c"), 0))
-        self.assertEqual(self.result[6], (EV_KEY, keyboard_layout.get("b"), 0))
-        self.assertEqual(self.result[7], (EV_KEY, keyboard_layout.get("a"), 0))
+        self.assertEqual(self.result[4], (EV_KEY, self.code_d, 0))
+        self.assertEqual(self.result[5], (EV_KEY, self.code_c, 0))
+        self.assertEqual(self.result[6], (EV_KEY, self.code_b, 0))
+        self.assertEqual(self.result[7], (EV_KEY, self.code_a, 0))
 
     async def test_raises_error(self):
         self.assertRaises(
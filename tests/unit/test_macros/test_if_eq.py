@@ -22,12 +22,12 @@
 import asyncio
 import multiprocessing
 import unittest
+from concurrent.futures import ProcessPoolExecutor
 
 from evdev.ecodes import (
     EV_KEY,
 )
 
-from inputremapper.configs.keyboard_layout import keyboard_layout
 from inputremapper.configs.validation_errors import MacroError
 from inputremapper.injection.macros.macro import macro_variables
 from inputremapper.injection.macros.parse import Parser
@@ -36,12 +36,19 @@ from tests.lib.test_setup import test_setup
 from tests.unit.test_macros.macro_test_base import DummyMapping, MacroTestBase
 
 
+def _set_foo(value):
+    # will write foo = value into the shared dictionary of macros
+    macro = Parser.parse(f"set(foo, {value})", None, DummyMapping)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(macro.run(lambda: None))
+
+
 @test_setup
 class TestIfEq(MacroTestBase):
     async def test_if_eq(self):
         """new version of ifeq"""
-        code_a = keyboard_layout.get("a")
-        code_b = keyboard_layout.get("b")
+        code_a = self.code_a
+        code_b = self.code_b
         a_press = [(EV_KEY, code_a, 1), (EV_KEY, code_a, 0)]
         b_press = [(EV_KEY, code_b, 1), (EV_KEY, code_b, 0)]
 
@@ -51,16 +58,35 @@ class TestIfEq(MacroTestBase):
             # cleanup
             macro_variables._clear()
             self.assertIsNone(macro_variables.get("a"))
-            self.result.clear()
+            self.reset_result()
 
             # test
             macro = Parser.parse(macro, self.context, DummyMapping)
             await macro.run(self.handler)
-            self.assertListEqual(self.result, expected)
+            self.assertEqual(self.result, expected)
+
+        # These don't use any variables, so they can't interfere with each other and
+        # run at the same time
+        independent_cases = [
+            ("if_eq(1, 1, key(a), key(b))", a_press),
+            ("if_eq(1, 2, key(a), key(b))", b_press),
+            ("if_eq(value_1=1, value_2=1, then=key(a), else=key(b))", a_press),
+            ('if_eq("\t", "\n", key(a), key(b))', b_press),
+            ('if_eq("value_1=1", 1, key(a), key(b))', b_press),
+        ]
+        results = [[] for _ in independent_cases]
+        await asyncio.gather(
+            *(
+                Parser.parse(macro, self.context, DummyMapping).run(
+                    lambda *event, result=result: result.append(event)
+                )
+                for (macro, _), result in zip(independent_cases, results)
+            )
+        )
+        for (macro, expected), result in zip(independent_cases, results):
+            with self.subTest(macro=macro):
+                self.assertEqual(result, expected)
 
-        await test("if_eq(1, 1, key(a), key(b))", a_press)
-        await test("if_eq(1, 2, key(a), key(b))", b_press)
-        await test("if_eq(value_1=1, value_2=1, then=key(a), else=key(b))", a_press)
         await test('set(a, "foo").if_eq($a, "foo", key(a), key(b))', a_press)
         await test('set(a, "foo").if_eq("foo", $a, key(a), key(b))', a_press)
         await test('set(a, "foo").if_eq("foo", $a, , key(b))', [])
@@ -78,14 +104,12 @@ class TestIfEq(MacroTestBase):
         await test("set(q, 1).if_eq($q, $w, key(a), else=key(b))", b_press)
         await test("set(q, 1).set(w, 1).if_eq($q, $w, key(a), else=key(b))", a_press)
         await test('set(q, " a b ").if_eq($q, " a b ", key(a), key(b))', a_press)
-        await test('if_eq("\t", "\n", key(a), key(b))', b_press)
 
         # treats values in quotes as strings, not as code
         await test('set(q, "$a").if_eq($q, "$a", key(a), key(b))', a_press)
         await test('set(q, "a,b").if_eq("a,b", $q, key(a), key(b))', a_press)
         await test('set(q, "c(1, 2)").if_eq("c(1, 2)", $q, key(a), key(b))', a_press)
         await test('set(q, "c(1, 2)").if_eq("c(1, 2)", "$q", key(a), key(b))', b_press)
-        await test('if_eq("value_1=1", 1, key(a), key(b))', b_press)
 
         # won't compare strings and int, be similar to python
         await test('set(a, "1").if_eq($a, 1, key(a), key(b))', b_press)
@@ -96,32 +120,30 @@ class TestIfEq(MacroTestBase):
         macro = Parser.parse(
             "if_eq($foo, 3, key(a), key(b))", self.context, DummyMapping
         )
-        code_a = keyboard_layout.get("a")
-        code_b = keyboard_layout.get("b")
+        code_a = self.code_a
+        code_b = self.code_b
 
         self.assertEqual(self.count_child_macros(macro), 2)
 
-        def set_foo(value):
-            # will write foo = 2 into the shared dictionary of macros
-            macro_2 = Parser.parse(f"set(foo, {value})", self.context, DummyMapping)
-            loop = asyncio.new_event_loop()
-            loop.run_until_complete(macro_2.run(lambda: None))
-
-        """foo is not 3"""
-
-        process = multiprocessing.Process(target=set_foo, args=(2,))
-        process.start()
-        process.join()
-        await macro.run(self.handler)
-        self.assertListEqual(self.result, [(EV_KEY, code_b, 1), (EV_KEY, code_b, 0)])
+        # A single worker process for both values. Not shared between tests, because
+        # the pipe of macro_variables is replaced after each test. It is forked, like
+        # the service does it, to inherit the shared dict of macro_variables. Forking
+        # isn't the default start method on every platform and Python version.
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("fork"),
+        ) as executor:
+            """foo is not 3"""
+
+            executor.submit(_set_foo, 2).result()
+            await macro.run(self.handler)
+            self.assertEqual(self.result, [(EV_KEY, code_b, 1), (EV_KEY, code_b, 0)])
 
-        """foo is 3"""
+            """foo is 3"""
 
-        process = multiprocessing.Process(target=set_foo, args=(3,))
-        process.start()
-        process.join()
-        await macro.run(self.handler)
-        self.assertListEqual(
+            executor.submit(_set_foo, 3).result()
+            await macro.run(self.handler)
+        self.assertEqual(
             self.result,
             [
                 (EV_KEY, code_b, 1),
@@ -147,15 +169,15 @@ class TestIfEqDeprecated(MacroTestBase):
             self.context,
             DummyMapping,
         )
-        code_a = keyboard_layout.get("a")
-        code_b = keyboard_layout.get("b")
+        code_a = self.code_a
+        code_b = self.code_b
 
         await macro.run(self.handler)
-        self.assertListEqual(self.result, [(EV_KEY, code_a, 1), (EV_KEY, code_a, 0)])
+        self.assertEqual(self.result, [(EV_KEY, code_a, 1), (EV_KEY, code_a, 0)])
         self.assertEqual(self.count_child_macros(macro), 2)
 
     async def test_ifeq_none(self):
-        code_a = keyboard_layout.get("a")
+        code_a = self.code_a
 
         # first param None
         macro = Parser.parse(
@@ -163,44 +185,44 @@ class TestIfEqDeprecated(MacroTestBase):
         )
         self.assertEqual(self.count_child_macros(macro), 1)
         await macro.run(self.handler)
-        self.assertListEqual(self.result, [])
+        self.assertEqual(self.result, [])
 
         # second param None
-        self.result = []
+        self.reset_result()
         macro = Parser.parse(
             "set(foo, 2).ifeq(foo, 2, key(a), None)", self.context, DummyMapping
         )
         self.assertEqual(self.count_child_macros(macro), 1)
         await macro.run(self.handler)
-        self.assertListEqual(self.result, [(EV_KEY, code_a, 1), (EV_KEY, code_a, 0)])
+        self.assertEqual(self.result, [(EV_KEY, code_a, 1), (EV_KEY, code_a, 0)])
 
         """Old syntax, use None instead"""
 
         # first param ""
-        self.result = []
+        self.reset_result()
         macro = Parser.parse(
             "set(foo, 2).ifeq(foo, 2, , key(b))", self.context, DummyMapping
         )
         self.assertEqual(self.count_child_macros(macro), 1)
         await macro.run(self.handler)
-        self.assertListEqual(self.result, [])
+        self.assertEqual(self.result, [])
 
         # second param ""
-        self.result = []
+        self.reset_result()
         macro = Parser.parse(
             "set(foo, 2).ifeq(foo, 2, key(a), )", self.context, DummyMapping
         )
         self.assertEqual(self.count_child_macros(macro), 1)
         await macro.run(self.handler)
-        self.assertListEqual(self.result, [(EV_KEY, code_a, 1), (EV_KEY, code_a, 0)])
+        self.assertEqual(self.result, [(EV_KEY, code_a, 1), (EV_KEY, code_a, 0)])
 
     async def test_ifeq_unknown_key(self):
         macro = Parser.parse("ifeq(qux, 2, key(a), key(b))", self.context, DummyMapping)
-        code_a = keyboard_layout.get("a")
-        code_b = keyboard_layout.get("b")
+        code_a = self.code_a
+        code_b = self.code_b
 
         await macro.run(self.handler)
-        self.assertListEqual(self.result, [(EV_KEY, code_b, 1), (EV_KEY, code_b, 0)])
+        self.assertEqual(self.result, [(EV_KEY, code_b, 1), (EV_KEY, code_b, 0)])
         self.assertEqual(self.count_child_macros(macro), 2)
 
     async def test_raises_error(self):
@@ -27,7 +27,6 @@ from evdev.ecodes import (
     ABS_Y,
 )
 
-from inputremapper.configs.keyboard_layout import keyboard_layout
 from inputremapper.configs.validation_errors import MacroError
 from inputremapper.injection.macros.parse import Parser
 from inputremapper.input_event import InputEvent
@@ -37,12 +36,14 @@ from tests.unit.test_macros.macro_test_base import DummyMapping, MacroTestBase
 
 @test_setup
 class TestIfSingle(MacroTestBase):
+    virtual_clock = True
+
     async def test_if_single(self):
         macro = Parser.parse("if_single(key(x), key(y))", self.context, DummyMapping)
         self.assertEqual(self.count_child_macros(macro), 2)
 
-        a = keyboard_layout.get("a")
-        x = keyboard_layout.get("x")
+        a = self.code_a
+        x = self.code_x
 
         await self.trigger_sequence(macro, InputEvent.key(a, 1))
         await asyncio.sleep(0.1)
@@ -50,7 +51,7 @@ class TestIfSingle(MacroTestBase):
         # the key that triggered the macro is released
         await asyncio.sleep(0.1)
 
-        self.assertListEqual(self.result, [(EV_KEY, x, 1), (EV_KEY, x, 0)])
+        self.assertEqual(self.result, [(EV_KEY, x, 1), (EV_KEY, x, 0)])
         self.assertFalse(macro.running)
 
     async def test_if_single_ignores_releases(self):
@@ -63,11 +64,11 @@ class TestIfSingle(MacroTestBase):
         )
         self.assertEqual(self.count_child_macros(macro), 2)
 
-        a = keyboard_layout.get("a")
-        b = keyboard_layout.get("b")
+        a = self.code_a
+        b = self.code_b
 
-        x = keyboard_layout.get("x")
-        y = keyboard_layout.get("y")
+        x = self.code_x
+        y = self.code_y
 
         # pressing the macro key
         await self.trigger_sequence(macro, InputEvent.key(a, 1))
@@ -77,16 +78,15 @@ class TestIfSingle(MacroTestBase):
         # it doesn't care if keys were released that have been
         # pressed before if_single. This was decided because it is a lot
         # less tricky and more fluently to use if you type fast
-        for listener in self.context.listeners:
-            asyncio.ensure_future(listener(InputEvent.key(b, 0)))
+        self.broadcast(InputEvent.key(b, 0))
         await asyncio.sleep(0.05)
-        self.assertListEqual(self.result, [])
+        self.assertEqual(self.result, [])
 
         # releasing the actual key triggers if_single
         await asyncio.sleep(0.05)
         await self.release_sequence(macro, InputEvent.key(a, 0))
         await asyncio.sleep(0.05)
-        self.assertListEqual(self.result, [(EV_KEY, x, 1), (EV_KEY, x, 0)])
+        self.assertEqual(self.result, [(EV_KEY, x, 1), (EV_KEY, x, 0)])
         self.assertFalse(macro.running)
 
     async def test_if_not_single(self):
@@ -101,41 +101,39 @@ class TestIfSingle(MacroTestBase):
         self.assertEqual(self.count_child_macros(macro), 3)
         self.assertEqual(self.count_tasks(macro), 4)
 
-        a = keyboard_layout.get("a")
-        b = keyboard_layout.get("b")
+        a = self.code_a
+        b = self.code_b
 
-        x = keyboard_layout.get("x")
-        y = keyboard_layout.get("y")
+        x = self.code_x
+        y = self.code_y
 
         # press the trigger key
         await self.trigger_sequence(macro, InputEvent.key(a, 1))
         await asyncio.sleep(0.1)
         # press another key
-        for listener in self.context.listeners:
-            asyncio.ensure_future(listener(InputEvent.key(b, 1)))
+        self.broadcast(InputEvent.key(b, 1))
         await asyncio.sleep(0.1)
 
-        self.assertListEqual(self.result, [(EV_KEY, y, 1), (EV_KEY, y, 0)])
+        self.assertEqual(self.result, [(EV_KEY, y, 1), (EV_KEY, y, 0)])
         self.assertFalse(macro.running)
 
     async def test_if_not_single_none(self):
         macro = Parser.parse("if_single(key(x),)", self.context, DummyMapping)
         self.assertEqual(self.count_child_macros(macro), 1)
 
-        a = keyboard_layout.get("a")
-        b = keyboard_layout.get("b")
+        a = self.code_a
+        b = self.code_b
 
-        x = keyboard_layout.get("x")
+        x = self.code_x
 
         # press trigger key
         await self.trigger_sequence(macro, InputEvent.key(a, 1))
         await asyncio.sleep(0.1)
         # press another key
-        for listener in self.context.listeners:
-            asyncio.ensure_future(listener(InputEvent.key(b, 1)))
+        self.broadcast(InputEvent.key(b, 1))
         await asyncio.sleep(0.1)
 
-        self.assertListEqual(self.result, [])
+        self.assertEqual(self.result, [])
         self.assertFalse(macro.running)
 
     async def test_if_single_times_out(self):
@@ -146,19 +144,19 @@ class TestIfSingle(MacroTestBase):
         )
         self.assertEqual(self.count_child_macros(macro), 2)
 
-        a = keyboard_layout.get("a")
-        y = keyboard_layout.get("y")
+        a = self.code_a
+        y = self.code_y
 
         await self.trigger_sequence(macro, InputEvent.key(a, 1))
 
         # no timeout yet
         await asyncio.sleep(0.2)
-        self.assertListEqual(self.result, [])
+        self.assertEqual(self.result, [])
         self.assertTrue(macro.running)
 
         # times out now
         await asyncio.sleep(0.2)
-        self.assertListEqual(self.result, [(EV_KEY, y, 1), (EV_KEY, y, 0)])
+        self.assertEqual(self.result, [(EV_KEY, y, 1), (EV_KEY, y, 0)])
         self.assertFalse(macro.running)
 
     async def test_if_single_ignores_joystick(self):
@@ -168,19 +166,18 @@ class TestIfSingle(MacroTestBase):
         macro = Parser.parse(
             "if_single(k(a), k(KEY_LEFTSHIFT))", self.context, DummyMapping
         )
-        code_shift = keyboard_layout.get("KEY_LEFTSHIFT")
-        code_a = keyboard_layout.get("a")
+        code_shift = self.code_shift
+        code_a = self.code_a
         trigger = 1
 
         await self.trigger_sequence(macro, InputEvent.key(trigger, 1))
         await asyncio.sleep(0.1)
-        for listener in self.context.listeners:
-            asyncio.ensure_future(listener(InputEvent.abs(ABS_Y, 10)))
+        self.broadcast(InputEvent.abs(ABS_Y, 10))
         await asyncio.sleep(0.1)
         await self.release_sequence(macro, InputEvent.key(trigger, 0))
         await asyncio.sleep(0.1)
         self.assertFalse(macro.running)
-        self.assertListEqual(self.result, [(EV_KEY, code_a, 1), (EV_KEY, code_a, 0)])
+        self.assertEqual(self.result, [(EV_KEY, code_a, 1), (EV_KEY, code_a, 0)])
 
     async def test_raises_error(self):
         Parser.parse("if_single(k(a),)", self.context)  # no error
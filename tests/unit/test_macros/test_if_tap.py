@@ -28,7 +28,6 @@ from evdev.ecodes import (
     KEY_B,
 )
 
-from inputremapper.configs.keyboard_layout import keyboard_layout
 from inputremapper.configs.validation_errors import MacroError
 from inputremapper.injection.macros.parse import Parser
 from tests.lib.test_setup import test_setup
@@ -37,12 +36,14 @@ from tests.unit.test_macros.macro_test_base import DummyMapping, MacroTestBase
 
 @test_setup
 class TestIfTap(MacroTestBase):
+    virtual_clock = True
+
     async def test_if_tap(self):
         macro = Parser.parse("if_tap(key(x), key(y), 100)", self.context, DummyMapping)
         self.assertEqual(self.count_child_macros(macro), 2)
 
-        x = keyboard_layout.get("x")
-        y = keyboard_layout.get("y")
+        x = self.code_x
+        y = self.code_y
 
         # this is the regular routine of how a macro is started. the tigger is pressed
         # already when the macro runs, and released during if_tap within the timeout.
@@ -52,7 +53,7 @@ class TestIfTap(MacroTestBase):
         macro.release_trigger()
         await asyncio.sleep(0.05)
 
-        self.assertListEqual(self.result, [(EV_KEY, x, 1), (EV_KEY, x, 0)])
+        self.assertEqual(self.result, [(EV_KEY, x, 1), (EV_KEY, x, 0)])
         self.assertFalse(macro.running)
 
     async def test_if_tap_2(self):
@@ -67,9 +68,9 @@ class TestIfTap(MacroTestBase):
         await asyncio.sleep(0.01)
         macro.release_trigger()
         await asyncio.sleep(0.2)
-        self.assertListEqual(self.result, [(EV_KEY, KEY_A, 1), (EV_KEY, KEY_A, 0)])
+        self.assertEqual(self.result, [(EV_KEY, KEY_A, 1), (EV_KEY, KEY_A, 0)])
         self.assertFalse(macro.running)
-        self.result.clear()
+        self.reset_result()
 
     async def test_if_double_tap(self):
         macro = Parser.parse(
@@ -94,9 +95,9 @@ class TestIfTap(MacroTestBase):
         macro.release_trigger()
 
         await asyncio.sleep(0.05)
-        self.assertListEqual(self.result, [(EV_KEY, KEY_A, 1), (EV_KEY, KEY_A, 0)])
+        self.assertEqual(self.result, [(EV_KEY, KEY_A, 1), (EV_KEY, KEY_A, 0)])
         self.assertFalse(macro.running)
-        self.result.clear()
+        self.reset_result()
 
         """If the second tap takes too long, runs else there"""
 
@@ -114,32 +115,32 @@ class TestIfTap(MacroTestBase):
         macro.release_trigger()
 
         await asyncio.sleep(0.05)
-        self.assertListEqual(self.result, [(EV_KEY, KEY_B, 1), (EV_KEY, KEY_B, 0)])
+        self.assertEqual(self.result, [(EV_KEY, KEY_B, 1), (EV_KEY, KEY_B, 0)])
         self.assertFalse(macro.running)
-        self.result.clear()
+        self.reset_result()
 
     async def test_if_tap_none(self):
         # first param none
         macro = Parser.parse("if_tap(, key(y), 100)", self.context, DummyMapping)
         self.assertEqual(self.count_child_macros(macro), 1)
-        y = keyboard_layout.get("y")
+        y = self.code_y
         macro.press_trigger()
         asyncio.ensure_future(macro.run(self.handler))
         await asyncio.sleep(0.05)
         macro.release_trigger()
         await asyncio.sleep(0.05)
-        self.assertListEqual(self.result, [])
+        self.assertEqual(self.result, [])
 
         # second param none
         macro = Parser.parse("if_tap(key(y), , 50)", self.context, DummyMapping)
         self.assertEqual(self.count_child_macros(macro), 1)
-        y = keyboard_layout.get("y")
+        y = self.code_y
         macro.press_trigger()
         asyncio.ensure_future(macro.run(self.handler))
         await asyncio.sleep(0.1)
         macro.release_trigger()
         await asyncio.sleep(0.05)
-        self.assertListEqual(self.result, [])
+        self.assertEqual(self.result, [])
 
         self.assertFalse(macro.running)
 
@@ -147,7 +148,7 @@ class TestIfTap(MacroTestBase):
         macro = Parser.parse("if_tap(key(x), key(y), 50)", self.context, DummyMapping)
         self.assertEqual(self.count_child_macros(macro), 2)
 
-        y = keyboard_layout.get("y")
+        y = self.code_y
 
         macro.press_trigger()
         asyncio.ensure_future(macro.run(self.handler))
@@ -155,7 +156,7 @@ class TestIfTap(MacroTestBase):
         macro.release_trigger()
         await asyncio.sleep(0.05)
 
-        self.assertListEqual(self.result, [(EV_KEY, y, 1), (EV_KEY, y, 0)])
+        self.assertEqual(self.result, [(EV_KEY, y, 1), (EV_KEY, y, 0)])
         self.assertFalse(macro.running)
 
     async def test_if_not_tap_named(self):
@@ -164,8 +165,8 @@ class TestIfTap(MacroTestBase):
         )
         self.assertEqual(self.count_child_macros(macro), 2)
 
-        x = keyboard_layout.get("x")
-        y = keyboard_layout.get("y")
+        x = self.code_x
+        y = self.code_y
 
         macro.press_trigger()
         asyncio.ensure_future(macro.run(self.handler))
@@ -173,7 +174,7 @@ class TestIfTap(MacroTestBase):
         macro.release_trigger()
         await asyncio.sleep(0.05)
 
-        self.assertListEqual(self.result, [(EV_KEY, y, 1), (EV_KEY, y, 0)])
+        self.assertEqual(self.result, [(EV_KEY, y, 1), (EV_KEY, y, 0)])
         self.assertFalse(macro.running)
 
     async def test_raises_error(self):
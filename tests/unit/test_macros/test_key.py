@@ -19,11 +19,11 @@
 # along with input-remapper.  If not, see <https://www.gnu.org/licenses/>.
 
 
+import asyncio
 import unittest
 
 from evdev.ecodes import EV_KEY
 
-from inputremapper.configs.keyboard_layout import keyboard_layout
 from inputremapper.configs.validation_errors import (
     MacroError,
     SymbolNotAvailableInTargetError,
@@ -36,79 +36,83 @@ from tests.unit.test_macros.macro_test_base import DummyMapping, MacroTestBase
 @test_setup
 class TestKey(MacroTestBase):
     async def test_1(self):
-        macro = Parser.parse("key(1)", self.context, DummyMapping, True)
-        one_code = keyboard_layout.get("1")
+        # Both macros press the same key, run them in one event loop
+        macros = [
+            Parser.parse("key(1)", self.context, DummyMapping, True),
+            Parser.parse("key(symbol=1)", self.context, DummyMapping, True),
+        ]
+        results = [[] for _ in macros]
 
-        await macro.run(self.handler)
-        self.assertListEqual(
-            self.result,
-            [(EV_KEY, one_code, 1), (EV_KEY, one_code, 0)],
-        )
-        self.assertEqual(self.count_child_macros(macro), 0)
-
-    async def test_named_parameter(self):
-        macro = Parser.parse("key(symbol=1)", self.context, DummyMapping, True)
-        one_code = keyboard_layout.get("1")
-
-        await macro.run(self.handler)
-        self.assertListEqual(
-            self.result,
-            [(EV_KEY, one_code, 1), (EV_KEY, one_code, 0)],
+        await asyncio.gather(
+            *(
+                macro.run(lambda *event, result=result: result.append(event))
+                for macro, result in zip(macros, results)
+            )
         )
-        self.assertEqual(self.count_child_macros(macro), 0)
+        for macro, result in zip(macros, results):
+            self.assertEqual(
+                result,
+                [(EV_KEY, self.code_1, 1), (EV_KEY, self.code_1, 0)],
+            )
+            self.assertEqual(self.count_child_macros(macro), 0)
 
     async def test_2(self):
         macro = Parser.parse('key(1).key("KEY_A").key(3)', self.context, DummyMapping)
 
         await macro.run(self.handler)
-        self.assertListEqual(
+        self.assertEqual(
             self.result,
             [
-                (EV_KEY, keyboard_layout.get("1"), 1),
-                (EV_KEY, keyboard_layout.get("1"), 0),
-                (EV_KEY, keyboard_layout.get("a"), 1),
-                (EV_KEY, keyboard_layout.get("a"), 0),
-                (EV_KEY, keyboard_layout.get("3"), 1),
-                (EV_KEY, keyboard_layout.get("3"), 0),
+                (EV_KEY, self.code_1, 1),
+                (EV_KEY, self.code_1, 0),
+                (EV_KEY, self.code_a, 1),
+                (EV_KEY, self.code_a, 0),
+                (EV_KEY, self.code_3, 1),
+                (EV_KEY, self.code_3, 0),
             ],
         )
         self.assertEqual(self.count_child_macros(macro), 0)
 
     async def test_key_down_up(self):
-        code_a = keyboard_layout.get("a")
-        code_b = keyboard_layout.get("b")
         macro = Parser.parse(
             "set(foo, b).key_down($foo).key_up($foo).key_up(a).key_down(a)",
             self.context,
             DummyMapping,
         )
         await macro.run(self.handler)
-        self.assertListEqual(
+        self.assertEqual(
             self.result,
             [
-                (EV_KEY, code_b, 1),
-                (EV_KEY, code_b, 0),
-                (EV_KEY, code_a, 0),
-                (EV_KEY, code_a, 1),
+                (EV_KEY, self.code_b, 1),
+                (EV_KEY, self.code_b, 0),
+                (EV_KEY, self.code_a, 0),
+                (EV_KEY, self.code_a, 1),
             ],
         )
 
     async def test_raises_error(self):
-        Parser.parse("k(1).h(k(a)).k(3)", self.context)  # No error
-        self.expect_string_in_error("bracket", "key((1)")
-        self.expect_string_in_error("bracket", "k(1))")
-        self.assertRaises(MacroError, Parser.parse, "k((1).k)", self.context)
-        self.assertRaises(MacroError, Parser.parse, "key(foo=a)", self.context)
-        self.assertRaises(
-            MacroError, Parser.parse, "key(symbol=a, foo=b)", self.context
-        )
-        self.assertRaises(MacroError, Parser.parse, "k()", self.context)
-        self.assertRaises(MacroError, Parser.parse, "key(invalidkey)", self.context)
-        self.assertRaises(MacroError, Parser.parse, 'key("invalidkey")', self.context)
-        Parser.parse("key(1)", self.context)  # no error
-        self.assertRaises(MacroError, Parser.parse, "k(1, 1)", self.context)
-        Parser.parse("key($a)", self.context)  # no error
-        self.assertRaises(MacroError, Parser.parse, "key(a)key(b)", self.context)
+        # Each case is a subTest, so that one failing case doesn't hide the others
+        for macro in ["k(1).h(k(a)).k(3)", "key(1)", "key($a)"]:
+            with self.subTest(macro=macro):
+                Parser.parse(macro, self.context)  # no error
+
+        for macro in ["key((1)", "k(1))"]:
+            with self.subTest(macro=macro):
+                self.expect_string_in_error("bracket", macro)
+
+        for macro in [
+            "k((1).k)",
+            "key(foo=a)",
+            "key(symbol=a, foo=b)",
+            "k()",
+            "key(invalidkey)",
+            'key("invalidkey")',
+            "k(1, 1)",
+            "key(a)key(b)",
+        ]:
+            with self.subTest(macro=macro):
+                self.assertRaises(MacroError, Parser.parse, macro, self.context)
+
         # wrong target for BTN_A
         self.assertRaises(
             SymbolNotAvailableInTargetError,
@@ -48,12 +48,12 @@ class TestLeds(MacroTestBase):
 
         with patch.object(self.source_device, "leds", side_effect=lambda: [LED_NUML]):
             await macro.run(self.handler)
-            self.assertListEqual(self.result, [(EV_KEY, KEY_2, 1), (EV_KEY, KEY_2, 0)])
+            self.assertEqual(self.result, [(EV_KEY, KEY_2, 1), (EV_KEY, KEY_2, 0)])
 
         with patch.object(self.source_device, "leds", side_effect=lambda: [LED_CAPSL]):
-            self.result = []
+            self.reset_result()
             await macro.run(self.handler)
-            self.assertListEqual(self.result, [(EV_KEY, KEY_1, 1), (EV_KEY, KEY_1, 0)])
+            self.assertEqual(self.result, [(EV_KEY, KEY_1, 1), (EV_KEY, KEY_1, 0)])
 
     async def test_if_numlock(self):
         macro = Parser.parse(
@@ -66,12 +66,12 @@ class TestLeds(MacroTestBase):
 
         with patch.object(self.source_device, "leds", side_effect=lambda: [LED_NUML]):
             await macro.run(self.handler)
-            self.assertListEqual(self.result, [(EV_KEY, KEY_1, 1), (EV_KEY, KEY_1, 0)])
+            self.assertEqual(self.result, [(EV_KEY, KEY_1, 1), (EV_KEY, KEY_1, 0)])
 
         with patch.object(self.source_device, "leds", side_effect=lambda: [LED_CAPSL]):
-            self.result = []
+            self.reset_result()
             await macro.run(self.handler)
-            self.assertListEqual(self.result, [(EV_KEY, KEY_2, 1), (EV_KEY, KEY_2, 0)])
+            self.assertEqual(self.result, [(EV_KEY, KEY_2, 1), (EV_KEY, KEY_2, 0)])
 
     async def test_if_numlock_no_else(self):
         macro = Parser.parse(
@@ -84,12 +84,12 @@ class TestLeds(MacroTestBase):
 
         with patch.object(self.source_device, "leds", side_effect=lambda: [LED_CAPSL]):
             await macro.run(self.handler)
-            self.assertListEqual(self.result, [])
+            self.assertEqual(self.result, [])
 
         with patch.object(self.source_device, "leds", side_effect=lambda: [LED_NUML]):
-            self.result = []
+            self.reset_result()
             await macro.run(self.handler)
-            self.assertListEqual(self.result, [(EV_KEY, KEY_1, 1), (EV_KEY, KEY_1, 0)])
+            self.assertEqual(self.result, [(EV_KEY, KEY_1, 1), (EV_KEY, KEY_1, 0)])
 
     async def test_if_capslock_no_then(self):
         macro = Parser.parse(
@@ -102,12 +102,12 @@ class TestLeds(MacroTestBase):
 
         with patch.object(self.source_device, "leds", side_effect=lambda: [LED_CAPSL]):
             await macro.run(self.handler)
-            self.assertListEqual(self.result, [])
+            self.assertEqual(self.result, [])
 
         with patch.object(self.source_device, "leds", side_effect=lambda: [LED_NUML]):
-            self.result = []
+            self.reset_result()
             await macro.run(self.handler)
-            self.assertListEqual(self.result, [(EV_KEY, KEY_1, 1), (EV_KEY, KEY_1, 0)])
+            self.assertEqual(self.result, [(EV_KEY, KEY_1, 1), (EV_KEY, KEY_1, 0)])
 
     async def test_raises_error(self):
         Parser.parse("if_capslock(else=key(KEY_A))", self.context)  # no error
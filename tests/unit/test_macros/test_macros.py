@@ -48,7 +48,7 @@ class TestMacros(MacroTestBase):
         m = keyboard_layout.get("m")
 
         await macro.run(self.handler)
-        self.assertListEqual(
+        self.assertEqual(
             self.result,
             [
                 (EV_KEY, r, 1),
@@ -67,7 +67,7 @@ class TestMacros(MacroTestBase):
         self.assertEqual(self.count_tasks(macro), 4)
 
     async def test_various(self):
-        start = time.time()
+        start = time.perf_counter()
         macro = Parser.parse(
             "w(200).repeat(2,modify(w,\nrepeat(2,\tkey(BtN_LeFt))).w(10).key(k))",
             self.context,
@@ -82,54 +82,56 @@ class TestMacros(MacroTestBase):
         k = keyboard_layout.get("k")
 
         await macro.run(self.handler)
+        elapsed = time.perf_counter() - start
 
         num_pauses = 8 + 6 + 4
         keystroke_time = num_pauses * DummyMapping.macro_key_sleep_ms
         wait_time = 220
         total_time = (keystroke_time + wait_time) / 1000
 
-        self.assertLess(time.time() - start, total_time * 1.2)
-        self.assertGreater(time.time() - start, total_time * 0.9)
+        self.assertLess(elapsed, total_time * 1.2)
+        self.assertGreater(elapsed, total_time * 0.9)
         expected = [(EV_KEY, w, 1)]
         expected += [(EV_KEY, left, 1), (EV_KEY, left, 0)] * 2
         expected += [(EV_KEY, w, 0)]
         expected += [(EV_KEY, k, 1), (EV_KEY, k, 0)]
         expected *= 2
-        self.assertListEqual(self.result, expected)
+        self.assertEqual(self.result, expected)
 
     async def test_not_run(self):
         # does nothing without .run
         macro = Parser.parse("key(a).repeat(3, key(b))", self.context)
         self.assertIsInstance(macro, Macro)
-        self.assertListEqual(self.result, [])
+        self.assertEqual(self.result, [])
 
     async def test_duplicate_run(self):
         # it won't restart the macro, because that may screw up the
         # internal state (in particular the _trigger_release_event).
         # I actually don't know at all what kind of bugs that might produce,
         # lets just avoid it. It might cause it to be held down forever.
-        a = keyboard_layout.get("a")
-        b = keyboard_layout.get("b")
-        c = keyboard_layout.get("c")
+        a = self.code_a
+        b = self.code_b
+        c = self.code_c
 
         macro = Parser.parse(
             "key(a).modify(b, hold()).key(c)", self.context, DummyMapping
         )
-        asyncio.ensure_future(macro.run(self.handler))
+        run = asyncio.ensure_future(macro.run(self.handler))
         self.assertFalse(macro.tasks[1].child_macros[0].tasks[0].is_holding())
 
         asyncio.ensure_future(macro.run(self.handler))  # ignored
         self.assertFalse(macro.tasks[1].child_macros[0].tasks[0].is_holding())
 
         macro.press_trigger()
-        await asyncio.sleep(0.2)
+        # key(a) and the modifier b
+        await self.wait_until(lambda: len(self.result) >= 3)
         self.assertTrue(macro.tasks[1].child_macros[0].tasks[0].is_holding())
 
         asyncio.ensure_future(macro.run(self.handler))  # ignored
         self.assertTrue(macro.tasks[1].child_macros[0].tasks[0].is_holding())
 
         macro.release_trigger()
-        await asyncio.sleep(0.2)
+        await asyncio.wait_for(run, 1)
         self.assertFalse(macro.tasks[1].child_macros[0].tasks[0].is_holding())
 
         expected = [
@@ -140,16 +142,16 @@ class TestMacros(MacroTestBase):
             (EV_KEY, c, 1),
             (EV_KEY, c, 0),
         ]
-        self.assertListEqual(self.result, expected)
+        self.assertEqual(self.result, expected)
 
         """not ignored, since previous run is over"""
 
-        asyncio.ensure_future(macro.run(self.handler))
+        run = asyncio.ensure_future(macro.run(self.handler))
         macro.press_trigger()
-        await asyncio.sleep(0.2)
+        await self.wait_until(lambda: len(self.result) >= 9)
         self.assertTrue(macro.tasks[1].child_macros[0].tasks[0].is_holding())
         macro.release_trigger()
-        await asyncio.sleep(0.2)
+        await asyncio.wait_for(run, 1)
         self.assertFalse(macro.tasks[1].child_macros[0].tasks[0].is_holding())
 
         expected = [
@@ -160,7 +162,7 @@ class TestMacros(MacroTestBase):
             (EV_KEY, c, 1),
             (EV_KEY, c, 0),
         ] * 2
-        self.assertListEqual(self.result, expected)
+        self.assertEqual(self.result, expected)
 
 
 if __name__ == "__main__":
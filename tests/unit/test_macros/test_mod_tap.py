@@ -54,9 +54,6 @@ class TestModTapIntegration(unittest.IsolatedAsyncioTestCase):
 
         self.bootstrap_event_reader()
 
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-
     def bootstrap_event_reader(self):
         self.context = Context(
             self.preset,
@@ -288,9 +285,11 @@ class TestModTapIntegration(unittest.IsolatedAsyncioTestCase):
         # mod_tap is busy replaying events. While it does that, inject this
         await self.input(EV_KEY, 100, 1)
 
-        start = time.time()
+        start = time.perf_counter()
         timeout = 2
-        while len(uinput_write_history) < 32 and (time.time() - start) < timeout:
+        while (
+            len(uinput_write_history) < 32 and (time.perf_counter() - start) < timeout
+        ):
             # Wait for it to complete
             await asyncio.sleep(0.1)
 
@@ -364,12 +363,12 @@ class TestModTapUnit(MacroTestBase):
     async def wait_for_timeout(self, macro):
         macro = Parser.parse(macro, self.context, DummyMapping, True)
 
-        start = time.time()
+        start = time.perf_counter()
         # Awaiting macro.run will cause it to wait for the tapping_term.
         # When it injects the modifier, release the trigger.
         macro.press_trigger()
         await macro.run(lambda *_, **__: macro.release_trigger())
-        return time.time() - start
+        return time.perf_counter() - start
 
     async def test_tapping_term_configuration_default(self):
         time_ = await self.wait_for_timeout("mod_tap(a, b)")
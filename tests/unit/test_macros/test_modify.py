@@ -23,7 +23,6 @@ import unittest
 
 from evdev.ecodes import EV_KEY
 
-from inputremapper.configs.keyboard_layout import keyboard_layout
 from inputremapper.configs.validation_errors import MacroError
 from inputremapper.injection.macros.parse import Parser
 from tests.lib.test_setup import test_setup
@@ -33,16 +32,16 @@ from tests.unit.test_macros.macro_test_base import MacroTestBase, DummyMapping
 @test_setup
 class TestModify(MacroTestBase):
     async def test_modify(self):
-        code_a = keyboard_layout.get("a")
-        code_b = keyboard_layout.get("b")
-        code_c = keyboard_layout.get("c")
+        code_a = self.code_a
+        code_b = self.code_b
+        code_c = self.code_c
         macro = Parser.parse(
             "set(foo, b).modify($foo, modify(a, key(c)))",
             self.context,
             DummyMapping,
         )
         await macro.run(self.handler)
-        self.assertListEqual(
+        self.assertEqual(
             self.result,
             [
                 (EV_KEY, code_b, 1),
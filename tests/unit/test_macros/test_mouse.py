@@ -154,14 +154,9 @@ class TestMouse(MacroTestBase):
 
         expected_num_hires_events = sleep * DummyMapping.rel_rate
         expected_num_wheel_events = int(expected_num_hires_events / 120 * wheel_speed)
-        actual_num_wheel_events = self.result.count((EV_REL, REL_HWHEEL, 1))
-        actual_num_hires_events = self.result.count(
-            (
-                EV_REL,
-                REL_HWHEEL_HI_RES,
-                wheel_speed,
-            )
-        )
+        counts = self.result_counts
+        actual_num_wheel_events = counts[(EV_REL, REL_HWHEEL, 1)]
+        actual_num_hires_events = counts[(EV_REL, REL_HWHEEL_HI_RES, wheel_speed)]
 
         self.assertGreater(
             actual_num_wheel_events,
@@ -234,12 +229,12 @@ class TestMouse(MacroTestBase):
             dummy_mapping,
         )
         macro.press_trigger()
-        asyncio.ensure_future(macro.run(self.handler))
+        run = asyncio.ensure_future(macro.run(self.handler))
 
         await asyncio.sleep(time)
         self.assertTrue(macro.tasks[0].is_holding())
         macro.release_trigger()
-        await asyncio.sleep(0.05)
+        await asyncio.wait_for(run, 1)
 
 
 if __name__ == "__main__":
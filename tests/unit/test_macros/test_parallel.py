@@ -95,14 +95,14 @@ class TestParallel(MacroTestBase):
         )
 
         macro.press_trigger()
-        asyncio.ensure_future(macro.run(self.handler))
-        await asyncio.sleep(0.05)
+        run = asyncio.ensure_future(macro.run(self.handler))
+        await self.wait_until(lambda: len(self.result) >= 2)
         self.assertIn((EV_KEY, KEY_A, 1), self.result)
         self.assertIn((EV_KEY, KEY_B, 1), self.result)
         self.assertEqual(len(self.result), 2)
 
         macro.release_trigger()
-        await asyncio.sleep(0.05)
+        await asyncio.wait_for(run, 1)
         self.assertIn((EV_KEY, KEY_A, 0), self.result)
         self.assertIn((EV_KEY, KEY_B, 0), self.result)
         self.assertIn((EV_KEY, KEY_C, 1), self.result)
@@ -38,6 +38,8 @@ from tests.lib.logger import logger
 from tests.lib.test_setup import test_setup
 from tests.unit.test_macros.macro_test_base import DummyMapping, MacroTestBase
 
+_WHITESPACE = re.compile(r"\s")
+
 
 @test_setup
 class TestParsing(MacroTestBase):
@@ -90,8 +92,7 @@ class TestParsing(MacroTestBase):
         self.assertEqual(Parser.remove_comments('#a"#""#"#b'), "")
 
         self.assertEqual(
-            re.sub(
-                r"\s",
+            _WHITESPACE.sub(
                 "",
                 Parser.remove_comments(
                     """
@@ -170,7 +171,7 @@ class TestParsing(MacroTestBase):
     async def test_extract_params(self):
         # splits strings, doesn't try to understand their meaning yet
         def expect(raw, expectation):
-            self.assertListEqual(Parser._extract_args(raw), expectation)
+            self.assertEqual(Parser._extract_args(raw), expectation)
 
         expect("a", ["a"])
         expect("a,b", ["a", "b"])
@@ -316,7 +317,7 @@ class TestParsing(MacroTestBase):
             DummyMapping,
         )
         await macro.run(self.handler)
-        self.assertListEqual(
+        self.assertEqual(
             self.result,
             [
                 (EV_KEY, KEY_A, 1),
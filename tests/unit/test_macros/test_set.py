@@ -24,7 +24,6 @@ import time
 
 from evdev.ecodes import EV_KEY, KEY_A
 
-from inputremapper.configs.keyboard_layout import keyboard_layout
 from inputremapper.configs.validation_errors import MacroError
 from inputremapper.injection.macros.macro import macro_variables
 from inputremapper.injection.macros.parse import Parser
@@ -35,10 +34,10 @@ from tests.unit.test_macros.macro_test_base import MacroTestBase, DummyMapping
 @test_setup
 class TestSet(MacroTestBase):
     async def test_set_key(self):
-        code_b = keyboard_layout.get("b")
+        code_b = self.code_b
         macro = Parser.parse("set(foo, b).key($foo)", self.context, DummyMapping)
         await macro.run(self.handler)
-        self.assertListEqual(
+        self.assertEqual(
             self.result,
             [
                 (EV_KEY, code_b, 1),
@@ -24,7 +24,6 @@ import unittest
 
 from evdev.ecodes import EV_KEY
 
-from inputremapper.configs.keyboard_layout import keyboard_layout
 from inputremapper.injection.macros.parse import Parser
 from tests.lib.test_setup import test_setup
 from tests.unit.test_macros.macro_test_base import MacroTestBase, DummyMapping
@@ -35,7 +34,7 @@ class TestToggle(MacroTestBase):
     async def test_toggle(self):
         # repeats key(a) as long as macro is toggled
         macro = Parser.parse("toggle(key(a))", self.context, DummyMapping)
-        code_a = keyboard_layout.get("a")
+        code_a = self.code_a
 
         self.assertEqual(self.count_child_macros(macro), 1)
         self.assertEqual(self.count_tasks(macro), 2)
@@ -43,26 +42,28 @@ class TestToggle(MacroTestBase):
         # Start
         macro.press_trigger()
         macro.release_trigger()
-        asyncio.ensure_future(macro.run(self.handler))
+        run = asyncio.ensure_future(macro.run(self.handler))
 
-        await asyncio.sleep(0.1)
-        count_1 = self.result.count((EV_KEY, code_a, 1))
-        self.assertGreater(count_1, 2)
-
-        # Keeps writing more
-        await asyncio.sleep(0.1)
-        count_2 = self.result.count((EV_KEY, code_a, 1))
-        self.assertGreater(count_2, count_1)
+        # wait_until fails the test if toggle doesn't keep writing
+        await self.wait_until(lambda: self.result_counts[(EV_KEY, code_a, 1)] > 2)
+        count_1 = self.result_counts[(EV_KEY, code_a, 1)]
+        await self.wait_until(lambda: self.result_counts[(EV_KEY, code_a, 1)] > count_1)
+        self.assertEqual(
+            set(self.result_counts), {(EV_KEY, code_a, 1), (EV_KEY, code_a, 0)}
+        )
 
         # Stop
         macro.press_trigger()
         macro.release_trigger()
+        await asyncio.wait_for(run, 1)
+        self.assertFalse(macro.running)
 
-        count_3 = self.result.count((EV_KEY, code_a, 1))
+        count_3 = self.result_counts[(EV_KEY, code_a, 1)]
         await asyncio.sleep(0.1)
-        count_4 = self.result.count((EV_KEY, code_a, 1))
+        count_4 = self.result_counts[(EV_KEY, code_a, 1)]
         # ensure that the macro has stopped
         self.assertEqual(count_3, count_4)
+        self.assertEqual(self.result[-1], (EV_KEY, code_a, 0))
 
 
 if __name__ == "__main__":
@@ -19,6 +19,7 @@
 # along with input-remapper.  If not, see <https://www.gnu.org/licenses/>.
 
 
+import asyncio
 import time
 import unittest
 
@@ -31,21 +32,39 @@ from tests.unit.test_macros.macro_test_base import DummyMapping, MacroTestBase
 
 @test_setup
 class TestWait(MacroTestBase):
+    async def _timed_run(self, macro: Macro) -> int:
+        start = time.perf_counter_ns()
+        await macro.run(self.handler)
+        return time.perf_counter_ns() - start
+
     async def assert_time_randomized(
         self,
-        macro: Macro,
+        code: str,
         min_: float,
         max_: float,
     ):
-        for _ in range(100):
-            start = time.time()
-            await macro.run(self.handler)
-            time_taken = time.time() - start
-
-            # Any of the runs should be within the defined range, to prove that they
-            # are indeed random.
-            if min_ < time_taken < max_:
-                return
+        mapping = DummyMapping()
+        mapping.macro_key_sleep_ms = 0
+        min_ns = int(min_ * 1e9)
+        max_ns = int(max_ * 1e9)
+        # A macro can't run twice at the same time, so parse a few copies and run
+        # them in parallel, in up to 10 rounds.
+        for _ in range(10):
+            tasks = [
+                asyncio.create_task(
+                    self._timed_run(Parser.parse(code, self.context, mapping, True))
+                )
+                for _ in range(10)
+            ]
+            try:
+                for next_run in asyncio.as_completed(tasks):
+                    # Any of the runs should be within the defined range, to prove
+                    # that they are indeed random.
+                    if min_ns < await next_run < max_ns:
+                        return
+            finally:
+                for task in tasks:
+                    task.cancel()
 
         raise AssertionError("`wait` was not randomized")
 
@@ -54,31 +73,22 @@ class TestWait(MacroTestBase):
         mapping.macro_key_sleep_ms = 0
         macro = Parser.parse("repeat(5, wait(50))", self.context, mapping, True)
 
-        start = time.time()
+        start = time.perf_counter_ns()
         await macro.run(self.handler)
-        time_per_iteration = (time.time() - start) / 5
+        time_per_iteration = (time.perf_counter_ns() - start) / 5 / 1e9
 
         self.assertLess(abs(time_per_iteration - 0.05), 0.005)
 
     async def test_wait_2_ranged(self):
-        mapping = DummyMapping()
-        mapping.macro_key_sleep_ms = 0
-        macro = Parser.parse("wait(1, 100)", self.context, mapping, True)
-        await self.assert_time_randomized(macro, 0.02, 0.08)
+        await self.assert_time_randomized("wait(1, 100)", 0.02, 0.08)
 
     async def test_wait_3_ranged_single_get(self):
-        mapping = DummyMapping()
-        mapping.macro_key_sleep_ms = 0
-        macro = Parser.parse("set(a, 100).wait(1, $a)", self.context, mapping, True)
-        await self.assert_time_randomized(macro, 0.02, 0.08)
+        await self.assert_time_randomized("set(a, 100).wait(1, $a)", 0.02, 0.08)
 
     async def test_wait_4_ranged_double_get(self):
-        mapping = DummyMapping()
-        mapping.macro_key_sleep_ms = 0
-        macro = Parser.parse(
-            "set(a, 1).set(b, 100).wait($a, $b)", self.context, mapping, True
+        await self.assert_time_randomized(
+            "set(a, 1).set(b, 100).wait($a, $b)", 0.02, 0.08
         )
-        await self.assert_time_randomized(macro, 0.02, 0.08)
 
     async def test_raises_error(self):
         Parser.parse("w(2)", self.context)  # no error
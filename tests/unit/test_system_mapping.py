@@ -24,7 +24,7 @@ import subprocess
 import unittest
 from unittest.mock import patch
 
-from evdev.ecodes import BTN_LEFT, KEY_A
+from evdev.ecodes import BTN_LEFT, KEY_A, KEY_LEFTALT
 
 from inputremapper.configs.paths import PathUtils
 from inputremapper.configs.keyboard_layout import KeyboardLayout, XMODMAP_FILENAME
@@ -55,6 +55,23 @@ class TestSystemMapping(unittest.TestCase):
             self.assertNotIn("KEY_A", content)
             self.assertNotIn("disable", content)
 
+    def test_xmodmap_file_unchanged(self):
+        keyboard_layout = KeyboardLayout()
+        path = os.path.join(PathUtils.config_path(), XMODMAP_FILENAME)
+        keyboard_layout.populate()
+        os.utime(path, ns=(1000, 1000))
+
+        # same xmodmap output, so the file doesn't have to be written again
+        keyboard_layout.populate()
+        self.assertEqual(os.stat(path).st_mtime_ns, 1000)
+
+        with open(path, "w") as file:
+            file.write("{}")
+
+        keyboard_layout.populate()
+        with open(path, "r") as file:
+            self.assertEqual(json.load(file)["a"], KEY_A)
+
     def test_empty_xmodmap(self):
         # if xmodmap returns nothing, don't write the file
         empty_xmodmap = ""
@@ -105,6 +122,19 @@ class TestSystemMapping(unittest.TestCase):
         self.assertEqual(keyboard_layout.get("ABCD_b"), 33)
         self.assertEqual(keyboard_layout.get("abcd_B"), 33)
 
+    def test_get_cache(self):
+        # Results of get are cached, but never outdated
+        keyboard_layout = KeyboardLayout()
+        keyboard_layout.clear()
+        self.assertIsNone(keyboard_layout.get("fOo"))
+
+        keyboard_layout._set("foo", 34)
+        self.assertEqual(keyboard_layout.get("fOo"), 34)
+        self.assertEqual(keyboard_layout.get("fOo"), 34)
+
+        keyboard_layout.clear()
+        self.assertIsNone(keyboard_layout.get("fOo"))
+
     def test_keyboard_layout(self):
         keyboard_layout = KeyboardLayout()
         keyboard_layout.populate()
@@ -145,6 +175,14 @@ class TestSystemMapping(unittest.TestCase):
 
         self.assertEqual(keyboard_layout.get("disable"), -1)
 
+    def test_get_name(self):
+        keyboard_layout = KeyboardLayout()
+        keyboard_layout.populate()
+        # uses the first name that xmodmap reports for the code
+        self.assertEqual(keyboard_layout.get_name(KEY_A), "a")
+        self.assertEqual(keyboard_layout.get_name(KEY_LEFTALT), "Alt_L")
+        self.assertEqual(keyboard_layout.get_name(BTN_LEFT), "BTN_LEFT")
+
     def test_get_name_no_xmodmap(self):
         # if xmodmap is not installed, uses the linux constant names
         keyboard_layout = KeyboardLayout()